@@ -5,79 +5,100 @@ Acoustic Inter-agent Linguistic Link v1.1
 Decodes AILL wire-format byte streams into structured expression trees.
 """
 
+import re
 import struct
+from array import array
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Optional, Union
 from enum import IntEnum
 
 from .codebook import (
     FrameControl, TypeMarker, Structure, Quantifier, Logic, Relational,
     Temporal, Modality, Pragmatic, Meta, Arithmetic, Escape,
-    BASE_CODEBOOK, BINARY_OPS, UNARY_OPS, TERNARY_OPS,
+    _BASE_BY_CODE, BINARY_OPS, UNARY_OPS, TERNARY_OPS,
 )
-from .encoder import crc8, decode_float16, decode_float32, decode_float64, decode_varint
-
+from .encoder import crc8, decode_varint
+
+# Precompiled big-endian readers, called as _X_FROM(buffer, offset)[0]
+_U16_FROM = struct.Struct('>H').unpack_from
+_I16_FROM = struct.Struct('>h').unpack_from
+_U32_FROM = struct.Struct('>I').unpack_from
+_I32_FROM = struct.Struct('>i').unpack_from
+_U64_FROM = struct.Struct('>Q').unpack_from
+_I64_FROM = struct.Struct('>q').unpack_from
+_F16_FROM = struct.Struct('>e').unpack_from
+_F32_FROM = struct.Struct('>f').unpack_from
+_F64_FROM = struct.Struct('>d').unpack_from
 
 # ═══════════════════════════════════════════════════════════════════════
 # AST Node Types
 # ═══════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True)
 class ASTNode:
     """Base AST node for decoded AILL expressions."""
     node_type: str
     code: int = 0
     mnemonic: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class LiteralNode(ASTNode):
     """A typed literal value."""
     value_type: str = ""
-    value: Any = None
+    value: Any = None    # memoryview into the wire data for "bytes"
 
-@dataclass
+@dataclass(slots=True)
 class StructNode(ASTNode):
     """A struct with named fields."""
     fields: dict = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class ListNode(ASTNode):
     """A homogeneous list."""
     count: int = 0
     elements: list = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
+class ArrayLiteralNode(ASTNode):
+    """A list of same-typed numeric literals, stored column-wise."""
+    value_type: str = ""
+    count: int = 0
+    values: array = None
+
+@dataclass(slots=True)
 class MapNode(ASTNode):
     """A key-value map."""
     count: int = 0
     pairs: list = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class OperationNode(ASTNode):
     """An operation (operator + operands)."""
     operator: str = ""
     operands: list = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class PragmaticNode(ASTNode):
     """A pragmatic act wrapping an expression."""
     act: str = ""
     expression: Any = None
 
-@dataclass
+@dataclass(slots=True)
 class ModalNode(ASTNode):
     """A modality wrapper."""
     modality: str = ""
     expression: Any = None
     extra: Any = None  # e.g., horizon for PREDICTED
 
-@dataclass
+@dataclass(slots=True)
 class TemporalNode(ASTNode):
     """A temporal modifier."""
     modifier: str = ""
     expression: Any = None
 
-@dataclass
+@dataclass(slots=True)
 class MetaHeaderNode(ASTNode):
     """Decoded meta header."""
     confidence: float = 1.0
@@ -88,24 +109,64 @@ class MetaHeaderNode(ASTNode):
     seqnum: Optional[int] = None
     annotations: dict = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class UtteranceNode(ASTNode):
     """A complete decoded utterance."""
     meta: MetaHeaderNode = None
     body: list = field(default_factory=list)
 
-@dataclass 
+@dataclass(slots=True)
 class DomainRefNode(ASTNode):
     """Reference to a domain codebook entry."""
     level: int = 1
     domain_code: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class ContextRefNode(ASTNode):
     """Reference to a Session Context Table entry."""
     sct_index: int = 0
 
 
+class _SharedLiteralNode(LiteralNode):
+    """A LiteralNode shared by every decode; assigning to it raises."""
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError("shared literal node is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("shared literal node is read-only")
+
+    def __reduce__(self):
+        return _shared_literal, (self.code, self.value_type, self.value)
+
+    def __repr__(self):
+        return repr(LiteralNode(self.node_type, self.code, self.mnemonic,
+                                self.value_type, self.value))
+
+    def __eq__(self, other):
+        if not isinstance(other, LiteralNode):
+            return NotImplemented
+        return ((self.node_type, self.code, self.mnemonic, self.value_type, self.value) ==
+                (other.node_type, other.code, other.mnemonic, other.value_type, other.value))
+
+def _shared_literal(code: int, value_type: str, value) -> LiteralNode:
+    node = object.__new__(_SharedLiteralNode)
+    for name, val in (("node_type", "literal"), ("code", code), ("mnemonic", ""),
+                      ("value_type", value_type), ("value", value)):
+        object.__setattr__(node, name, val)
+    return node
+
+# Null and boolean literals decode to these shared, read-only instances
+# rather than a fresh node each
+_NULL_LIT = _shared_literal(int(TypeMarker.TYPE_NULL), "null", None)
+_TRUE_LIT = _shared_literal(int(TypeMarker.TYPE_BOOL), "bool", True)
+_FALSE_LIT = _shared_literal(int(TypeMarker.TYPE_BOOL), "bool", False)
+
+# Cap on the LiteralNodes each decoder keeps for reuse after release()
+_LITERAL_POOL_MAX = 4096
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Decoder Errors
 # ═══════════════════════════════════════════════════════════════════════
@@ -129,6 +190,10 @@ class DecodedEpoch:
     crc_ok: bool
 
 
+# Epoch header: sequence number, payload length
+_EPOCH_HDR = struct.Struct('>HH')
+
+
 def decode_epoch(data: bytes, offset: int = 0) -> tuple[DecodedEpoch, int]:
     """
     Decode a single epoch from wire bytes.
@@ -137,8 +202,7 @@ def decode_epoch(data: bytes, offset: int = 0) -> tuple[DecodedEpoch, int]:
     if len(data) - offset < 5:  # minimum: seq(2) + len(2) + crc(1)
         raise AILLDecodeError("Insufficient data for epoch header", offset)
 
-    seq_num = struct.unpack('>H', data[offset:offset+2])[0]
-    payload_len = struct.unpack('>H', data[offset+2:offset+4])[0]
+    seq_num, payload_len = _EPOCH_HDR.unpack_from(data, offset)
 
     if len(data) - offset < 4 + payload_len + 1:
         raise AILLDecodeError(f"Incomplete epoch payload (expected {payload_len} bytes)", offset)
@@ -154,6 +218,57 @@ def decode_epoch(data: bytes, offset: int = 0) -> tuple[DecodedEpoch, int]:
     return DecodedEpoch(seq_num, payload, crc_ok), total_consumed
 
 
+def decode_epochs(data: bytes, executor: Optional[Executor] = None) -> list[DecodedEpoch]:
+    """
+    Decode a stream of back-to-back epochs.
+    Raises AILLDecodeError if the stream ends inside an epoch.
+
+    The stream is framed in a single scan, then every epoch's CRC is checked
+    independently, via executor.map if the caller supplies an executor.
+    """
+    starts = []
+    crc_ends = []
+    offset = 0
+    end = len(data)
+    while offset < end:
+        if end - offset < 5:
+            raise AILLDecodeError("Insufficient data for epoch header", offset)
+        crc_pos = offset + 4 + ((data[offset + 2] << 8) | data[offset + 3])
+        if crc_pos >= end:
+            raise AILLDecodeError(
+                f"Incomplete epoch payload (expected {crc_pos - offset - 4} bytes)", offset)
+        starts.append(offset)
+        crc_ends.append(crc_pos)
+        offset = crc_pos + 1
+
+    segments = [data[s:e] for s, e in zip(starts, crc_ends)]
+    if executor is None:
+        crcs = list(map(crc8, segments))
+    else:
+        crcs = list(executor.map(crc8, segments))
+
+    return [DecodedEpoch((seg[0] << 8) | seg[1], data[s + 4:e], data[e] == crc)
+            for seg, s, e, crc in zip(segments, starts, crc_ends, crcs)]
+
+
+# Frame kinds for the explicit decode stack in AILLDecoder._decode_expression:
+#   [_F_STRUCT, fields, pending_key]
+#   [_F_LIST, elements, remaining, count]
+#   [_F_MAP, pairs, remaining, count, pending_key_node]
+#   [_F_WRAP, node]     - child becomes node.expression
+#   [_F_DISCARD, node]  - child is decoded and dropped
+_F_STRUCT, _F_LIST, _F_MAP, _F_WRAP, _F_DISCARD = range(5)
+
+# CONFIDENCE f16, PRIORITY u8, TIMESTAMP_META i64 with their codes skipped
+_META_FIXED = struct.Struct('>xexBxq')
+
+# A run of NOP padding bytes
+_NOP_RUN = re.compile(re.escape(bytes((Escape.NOP,))) + b'+')
+
+# "No child decoded yet" marker; distinct from None, which is a valid child
+_MORE = object()
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Main Decoder
 # ═══════════════════════════════════════════════════════════════════════
@@ -165,11 +280,23 @@ class AILLDecoder:
     Usage:
         decoder = AILLDecoder()
         utterance = decoder.decode_utterance(wire_bytes)
+
+    With packed_lists=True, lists whose elements are all the same fixed-width
+    numeric type decode to a single ArrayLiteralNode backed by an array.array
+    instead of one LiteralNode per element.
+
+    A decoder holds per-call state and its own literal freelist, so use one
+    decoder per thread.
     """
 
-    def __init__(self):
+    def __init__(self, packed_lists: bool = False):
+        self._packed_lists = packed_lists
         self._data: bytes = b''
+        self._mv: memoryview = memoryview(b'')
         self._pos: int = 0
+        # Freelist of LiteralNodes handed back through release(), reused by
+        # _decode_literal before allocating new ones
+        self._literal_pool: list[LiteralNode] = []
 
     def _remaining(self) -> int:
         return len(self._data) - self._pos
@@ -180,120 +307,189 @@ class AILLDecoder:
         return self._data[self._pos]
 
     def _read_byte(self) -> int:
-        if self._pos >= len(self._data):
-            raise AILLDecodeError("Unexpected end of data", self._pos)
-        val = self._data[self._pos]
-        self._pos += 1
-        return val
-
-    def _read_bytes(self, n: int) -> bytes:
-        if self._pos + n > len(self._data):
-            raise AILLDecodeError(f"Need {n} bytes, only {self._remaining()} available", self._pos)
-        val = self._data[self._pos:self._pos + n]
-        self._pos += n
-        return val
+        pos = self._pos
+        data = self._data
+        if pos >= len(data):
+            raise AILLDecodeError("Unexpected end of data", pos)
+        self._pos = pos + 1
+        return data[pos]
+
+    def _advance(self, n: int) -> int:
+        """Claim n bytes at the cursor, returning the offset they start at."""
+        pos = self._pos
+        if pos + n > len(self._data):
+            raise AILLDecodeError(f"Need {n} bytes, only {self._remaining()} available", pos)
+        self._pos = pos + n
+        return pos
+
+    def _read_bytes(self, n: int) -> memoryview:
+        """Return a zero-copy view of the next n bytes of the input."""
+        pos = self._advance(n)
+        return self._mv[pos:pos + n]
+
+    # Fixed-width values are unpacked in place from the backing buffer with
+    # the module-level precompiled Structs rather than sliced out first.
 
     def _read_uint8(self) -> int:
         return self._read_byte()
 
     def _read_int8(self) -> int:
-        return struct.unpack('>b', self._read_bytes(1))[0]
+        val = self._read_byte()
+        return val - 0x100 if val & 0x80 else val
 
     def _read_uint16(self) -> int:
-        return struct.unpack('>H', self._read_bytes(2))[0]
+        return _U16_FROM(self._data, self._advance(2))[0]
 
     def _read_int16(self) -> int:
-        return struct.unpack('>h', self._read_bytes(2))[0]
+        return _I16_FROM(self._data, self._advance(2))[0]
 
     def _read_uint32(self) -> int:
-        return struct.unpack('>I', self._read_bytes(4))[0]
+        return _U32_FROM(self._data, self._advance(4))[0]
 
     def _read_int32(self) -> int:
-        return struct.unpack('>i', self._read_bytes(4))[0]
+        return _I32_FROM(self._data, self._advance(4))[0]
 
     def _read_int64(self) -> int:
-        return struct.unpack('>q', self._read_bytes(8))[0]
+        return _I64_FROM(self._data, self._advance(8))[0]
 
     def _read_uint64(self) -> int:
-        return struct.unpack('>Q', self._read_bytes(8))[0]
+        return _U64_FROM(self._data, self._advance(8))[0]
 
     def _read_float16(self) -> float:
-        return decode_float16(self._read_bytes(2))
+        return _F16_FROM(self._data, self._advance(2))[0]
 
     def _read_float32(self) -> float:
-        return decode_float32(self._read_bytes(4))
+        return _F32_FROM(self._data, self._advance(4))[0]
 
     def _read_float64(self) -> float:
-        return decode_float64(self._read_bytes(8))
+        return _F64_FROM(self._data, self._advance(8))[0]
 
     def _read_string(self) -> str:
         length = self._read_uint16()
-        return self._read_bytes(length).decode('utf-8')
+        return str(self._read_bytes(length), 'utf-8')
 
     def _read_uuid(self) -> bytes:
-        return self._read_bytes(16)
+        # UUIDs escape into the AST, so materialize them
+        return bytes(self._read_bytes(16))
 
     def _read_varint(self) -> int:
-        val, consumed = decode_varint(self._data, self._pos)
-        self._pos += consumed
+        data, pos = self._data, self._pos
+        if pos >= len(data):
+            raise AILLDecodeError("Unexpected end of data", pos)
+        first = data[pos]
+        if first < 0x80:
+            # Single-byte form inline, skipping the decode_varint call
+            self._pos = pos + 1
+            return first
+        try:
+            val, consumed = decode_varint(data, pos)
+        except ValueError as e:
+            raise AILLDecodeError(str(e), pos) from None
+        self._pos = pos + consumed
         return val
 
     # ── Decode entry points ──
 
     def decode_utterance(self, data: bytes) -> UtteranceNode:
-        """Decode a complete AILL utterance from wire bytes."""
+        """
+        Decode a complete AILL utterance from wire bytes.
+        TYPE_BYTES literal values are memoryviews into `data` (zero-copy);
+        call bytes() on them if they must outlive or detach from it. While
+        any of them is alive, a bytearray `data` cannot be resized. Null
+        and boolean literals are shared, read-only node instances.
+        """
         self._data = data
+        self._mv = memoryview(data)
         self._pos = 0
-
-        # Expect START_UTTERANCE
-        code = self._read_byte()
-        if code != FrameControl.START_UTTERANCE:
-            raise AILLDecodeError(f"Expected START_UTTERANCE (0x00), got 0x{code:02X}", 0)
-
-        # Decode meta header
-        meta = self._decode_meta_header()
-
-        # Decode body expressions until END_UTTERANCE
-        body = []
-        while self._pos < len(self._data):
-            if self._peek() == FrameControl.END_UTTERANCE:
-                self._read_byte()  # consume END_UTTERANCE
-                break
-            expr = self._decode_expression()
-            if expr is not None:
-                body.append(expr)
-
-        return UtteranceNode(
-            node_type="utterance",
-            meta=meta,
-            body=body,
-        )
+        try:
+            # Expect START_UTTERANCE
+            code = self._read_byte()
+            if code != FrameControl.START_UTTERANCE:
+                raise AILLDecodeError(f"Expected START_UTTERANCE (0x00), got 0x{code:02X}", 0)
+
+            # Decode meta header
+            meta = self._decode_meta_header()
+
+            # Decode body expressions until END_UTTERANCE
+            body = []
+            end = len(data)
+            while self._pos < end:
+                code = data[self._pos]
+                if code == FrameControl.END_UTTERANCE:
+                    self._pos += 1  # consume END_UTTERANCE
+                    break
+                if code == Escape.NOP:
+                    # Padding between top-level expressions: skip the whole run
+                    self._pos = _NOP_RUN.match(data, self._pos).end()
+                    continue
+                expr = self._decode_expression()
+                if expr is not None:
+                    body.append(expr)
+
+            return UtteranceNode(
+                node_type="utterance",
+                meta=meta,
+                body=body,
+            )
+        finally:
+            # Drop the export of `data` so the caller can resize or reuse
+            # it; only TYPE_BYTES slices keep it alive past this call
+            self._mv.release()
+            self._mv = memoryview(b'')
+
+    def release(self, node: ASTNode) -> None:
+        """
+        Return the LiteralNodes of a tree this decoder produced to its
+        freelist. Call only once the tree is no longer needed. Released
+        literal nodes are cleared now and overwritten in place by later
+        decodes, so neither the tree nor any node taken from it may be used
+        after release().
+        """
+        pool = self._literal_pool
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            cls = n.__class__
+            if cls is LiteralNode:   # shared null/bool nodes never match
+                if len(pool) < _LITERAL_POOL_MAX:
+                    n.value = None
+                    pool.append(n)
+            elif cls is UtteranceNode or cls is ListNode:
+                stack.extend(n.body if cls is UtteranceNode else n.elements)
+            elif cls is StructNode:
+                stack.extend(n.fields.values())
+            elif cls is OperationNode:
+                stack.extend(n.operands)
+            elif cls is MapNode:
+                for key, val in n.pairs:
+                    stack.append(key)
+                    stack.append(val)
+            elif cls is PragmaticNode or cls is ModalNode or cls is TemporalNode:
+                stack.append(n.expression)
+            # Leaves (and None from NOP/COMMENT) need nothing
 
     def _decode_meta_header(self) -> MetaHeaderNode:
         """Decode the mandatory meta header."""
         meta = MetaHeaderNode(node_type="meta_header")
-
-        # CONFIDENCE (mandatory)
-        code = self._read_byte()
-        if code != Meta.CONFIDENCE:
-            raise AILLDecodeError(f"Expected CONFIDENCE (0x90), got 0x{code:02X}", self._pos - 1)
-        meta.confidence = self._read_float16()
-
-        # PRIORITY (mandatory)
-        code = self._read_byte()
-        if code != Meta.PRIORITY:
-            raise AILLDecodeError(f"Expected PRIORITY (0x91), got 0x{code:02X}", self._pos - 1)
-        meta.priority = self._read_uint8()
-
-        # TIMESTAMP (mandatory)
-        code = self._read_byte()
-        if code != Meta.TIMESTAMP_META:
-            raise AILLDecodeError(f"Expected TIMESTAMP_META (0x94), got 0x{code:02X}", self._pos - 1)
-        meta.timestamp_us = self._read_int64()
+        data = self._data
+        end = len(data)
+        pos = self._pos
+
+        # Well-formed mandatory fields are unpacked in one go; anything else
+        # takes the field-by-field path for precise errors
+        if (pos + _META_FIXED.size <= end and data[pos] == Meta.CONFIDENCE and
+                data[pos + 3] == Meta.PRIORITY and data[pos + 5] == Meta.TIMESTAMP_META):
+            meta.confidence, meta.priority, meta.timestamp_us = _META_FIXED.unpack_from(data, pos)
+            self._pos = pos + _META_FIXED.size
+        else:
+            self._decode_meta_fields(meta)
 
         # Optional meta annotations
-        while self._pos < len(self._data) and self._peek() in range(0x92, 0xA0):
-            ann_code = self._read_byte()
+        while self._pos < end:
+            ann_code = data[self._pos]
+            if not 0x92 <= ann_code < 0xA0:
+                break
+            self._pos += 1
             if ann_code == Meta.SOURCE_AGENT:
                 meta.source_agent = self._read_uuid()
             elif ann_code == Meta.DEST_AGENT:
@@ -313,195 +509,294 @@ class AILLDecoder:
 
         return meta
 
+    def _decode_meta_fields(self, meta: MetaHeaderNode) -> None:
+        """Read the mandatory meta fields one at a time, validating each code."""
+        # CONFIDENCE (mandatory)
+        code = self._read_byte()
+        if code != Meta.CONFIDENCE:
+            raise AILLDecodeError(f"Expected CONFIDENCE (0x90), got 0x{code:02X}", self._pos - 1)
+        meta.confidence = self._read_float16()
+
+        # PRIORITY (mandatory)
+        code = self._read_byte()
+        if code != Meta.PRIORITY:
+            raise AILLDecodeError(f"Expected PRIORITY (0x91), got 0x{code:02X}", self._pos - 1)
+        meta.priority = self._read_uint8()
+
+        # TIMESTAMP (mandatory)
+        code = self._read_byte()
+        if code != Meta.TIMESTAMP_META:
+            raise AILLDecodeError(f"Expected TIMESTAMP_META (0x94), got 0x{code:02X}", self._pos - 1)
+        meta.timestamp_us = self._read_int64()
+
     def _decode_expression(self) -> Optional[ASTNode]:
-        """Decode a single expression from the current position."""
-        if self._pos >= len(self._data):
+        """
+        Decode a single expression from the current position.
+
+        Nesting is handled with an explicit stack of container frames rather
+        than recursion, so depth is bounded by memory, not the interpreter's
+        recursion limit. Handlers either return a finished node or open a
+        frame (a list headed by one of the _F_* kinds); each frame is resumed
+        with its children's results until it completes.
+        """
+        data = self._data
+        end = len(data)
+        if self._pos >= end:
             return None
+        stack = []
+        while True:
+            # Decode whatever starts at the cursor
+            if self._pos >= end:
+                child = None
+            else:
+                child = _EXPRESSION_DISPATCH[data[self._pos]](self)
+                if child.__class__ is list:
+                    stack.append(child)
+                    child = _MORE
+
+            # Hand the result up until some frame needs another child
+            while stack:
+                frame = stack[-1]
+                kind = frame[0]
+
+                if kind == _F_STRUCT:
+                    fields = frame[1]
+                    if child is not _MORE:
+                        fields[frame[2]] = child
+                    while True:
+                        pos = self._pos
+                        if pos >= end or data[pos] == Structure.END_STRUCT:
+                            child = None
+                            break
+                        if data[pos] == Structure.FIELD_SEP:
+                            self._pos = pos + 1
+                            continue
+                        if data[pos] == Structure.FIELD_ID:
+                            self._pos = pos + 1
+                            frame[2] = self._read_uint16()
+                        else:
+                            frame[2] = len(fields)  # unnamed (positional) field
+                        child = _MORE
+                        break
+                    if child is _MORE:
+                        break
+                    if self._pos < end:
+                        self._pos += 1  # consume END_STRUCT
+                    child = StructNode(node_type="struct", fields=fields)
+
+                elif kind == _F_LIST:
+                    elements = frame[1]
+                    if child is not _MORE:
+                        elements.append(child)
+                    # Decode elements in place; only a nested container
+                    # (a new frame) leaves this loop early
+                    remaining = frame[2]
+                    pos = self._pos
+                    while remaining and pos < end and data[pos] != Structure.END_LIST:
+                        remaining -= 1
+                        child = _EXPRESSION_DISPATCH[data[pos]](self)
+                        if child.__class__ is list:
+                            break
+                        elements.append(child)
+                        pos = self._pos
+                    else:
+                        if pos < end and data[pos] == Structure.END_LIST:
+                            self._pos = pos + 1  # consume END_LIST
+                        stack.pop()
+                        child = ListNode(node_type="list", count=frame[3], elements=elements)
+                        continue
+                    frame[2] = remaining
+                    stack.append(child)
+                    child = _MORE
+                    continue
+
+                elif kind == _F_MAP:
+                    if child is not _MORE:
+                        if frame[4] is _MORE:
+                            frame[4] = child  # have the key, decode its value next
+                            child = _MORE
+                            break
+                        frame[1].append((frame[4], child))
+                        frame[4] = _MORE
+                    pos = self._pos
+                    if frame[2] and pos < end and data[pos] != Structure.END_MAP:
+                        frame[2] -= 1
+                        child = _MORE
+                        break
+                    if pos < end and data[pos] == Structure.END_MAP:
+                        self._pos = pos + 1  # consume END_MAP
+                    child = MapNode(node_type="map", count=frame[3], pairs=frame[1])
 
-        code = self._peek()
-
-        # Pragmatic acts (0x80-0x8F)
-        if 0x80 <= code <= 0x8F:
-            return self._decode_pragmatic()
-
-        # Modality (0x70-0x7F)
-        if 0x70 <= code <= 0x7F:
-            return self._decode_modal()
-
-        # Temporal (0x60-0x6F)
-        if 0x60 <= code <= 0x6F:
-            return self._decode_temporal()
-
-        # Meta annotations inline
-        if code == Meta.CONFIDENCE or code == Meta.LABEL:
-            return self._decode_annotation()
-
-        # Type markers (literals)
-        if 0x10 <= code <= 0x1F:
-            return self._decode_literal()
-
-        # Structure codes
-        if code == Structure.BEGIN_STRUCT:
-            return self._decode_struct()
-        if code == Structure.BEGIN_LIST:
-            return self._decode_list()
-        if code == Structure.BEGIN_MAP:
-            return self._decode_map()
-
-        # Escape/domain refs
-        if code in (Escape.ESCAPE_L1, Escape.ESCAPE_L2, Escape.ESCAPE_L3):
-            return self._decode_domain_ref()
-
-        # Context ref
-        if code == Meta.CONTEXT_REF:
-            self._read_byte()
-            idx = self._read_varint()
-            return ContextRefNode(node_type="context_ref", sct_index=idx)
-
-        # NOP / COMMENT (skip)
-        if code == Escape.NOP:
-            self._read_byte()
-            return None
-        if code == Escape.COMMENT:
-            self._read_byte()
-            _comment = self._read_string()
-            return None
+                else:  # _F_WRAP / _F_DISCARD: single-operand prefix nodes
+                    if child is _MORE:
+                        break
+                    if kind == _F_WRAP:
+                        frame[1].expression = child
+                    child = frame[1]
 
-        # Operators and other codes - just emit as-is
+                stack.pop()
+            else:
+                return child
+
+    def _decode_code(self) -> ASTNode:
+        """Operators and other codes - just emit as-is."""
+        code = self._read_byte()
+        return ASTNode(node_type="code", code=code, mnemonic=_MNEMONIC[code])
+
+    def _decode_context_ref(self) -> ContextRefNode:
+        """Decode a CONTEXT_REF to a Session Context Table entry."""
+        self._read_byte()
+        idx = self._read_varint()
+        return ContextRefNode(node_type="context_ref", sct_index=idx)
+
+    def _skip_nop(self) -> None:
+        self._read_byte()
+        return None
+
+    def _skip_comment(self) -> None:
         self._read_byte()
-        entry = BASE_CODEBOOK.get(code)
-        mnemonic = entry.mnemonic if entry else f"UNKNOWN_0x{code:02X}"
-        return ASTNode(node_type="code", code=code, mnemonic=mnemonic)
+        self._read_string()  # still validated as UTF-8, then dropped
+        return None
 
     def _decode_literal(self) -> LiteralNode:
         """Decode a typed literal value."""
-        code = self._read_byte()
+        # Only reached via dispatch on the byte at the cursor, so it exists
+        pos = self._pos
+        code = self._data[pos]
+        self._pos = pos + 1
+        try:
+            value_type, reader = _LITERAL_TABLE[code]
+        except KeyError:
+            raise AILLDecodeError(f"Unknown type marker 0x{code:02X}", pos) from None
+        value = reader(self)
+        pool = self._literal_pool
+        if pool:
+            node = pool.pop()
+            node.node_type = "literal"
+            node.code = code
+            node.mnemonic = ""
+            node.value_type = value_type
+            node.value = value
+            return node
+        return LiteralNode("literal", code, "", value_type, value)
+
+    def _decode_null(self) -> LiteralNode:
+        """TYPE_NULL: always the shared _NULL_LIT node."""
+        self._pos += 1
+        return _NULL_LIT
 
-        if code == TypeMarker.TYPE_INT8:
-            return LiteralNode(node_type="literal", code=code, value_type="int8", value=self._read_int8())
-        elif code == TypeMarker.TYPE_INT16:
-            return LiteralNode(node_type="literal", code=code, value_type="int16", value=self._read_int16())
-        elif code == TypeMarker.TYPE_INT32:
-            return LiteralNode(node_type="literal", code=code, value_type="int32", value=self._read_int32())
-        elif code == TypeMarker.TYPE_INT64:
-            return LiteralNode(node_type="literal", code=code, value_type="int64", value=self._read_int64())
-        elif code == TypeMarker.TYPE_UINT8:
-            return LiteralNode(node_type="literal", code=code, value_type="uint8", value=self._read_uint8())
-        elif code == TypeMarker.TYPE_UINT16:
-            return LiteralNode(node_type="literal", code=code, value_type="uint16", value=self._read_uint16())
-        elif code == TypeMarker.TYPE_UINT32:
-            return LiteralNode(node_type="literal", code=code, value_type="uint32", value=self._read_uint32())
-        elif code == TypeMarker.TYPE_UINT64:
-            return LiteralNode(node_type="literal", code=code, value_type="uint64", value=self._read_uint64())
-        elif code == TypeMarker.TYPE_FLOAT16:
-            return LiteralNode(node_type="literal", code=code, value_type="float16", value=self._read_float16())
-        elif code == TypeMarker.TYPE_FLOAT32:
-            return LiteralNode(node_type="literal", code=code, value_type="float32", value=self._read_float32())
-        elif code == TypeMarker.TYPE_FLOAT64:
-            return LiteralNode(node_type="literal", code=code, value_type="float64", value=self._read_float64())
-        elif code == TypeMarker.TYPE_BOOL:
-            return LiteralNode(node_type="literal", code=code, value_type="bool", value=self._read_uint8() != 0)
-        elif code == TypeMarker.TYPE_STRING:
-            return LiteralNode(node_type="literal", code=code, value_type="string", value=self._read_string())
-        elif code == TypeMarker.TYPE_BYTES:
-            length = self._read_uint16()
-            return LiteralNode(node_type="literal", code=code, value_type="bytes", value=self._read_bytes(length))
-        elif code == TypeMarker.TYPE_TIMESTAMP:
-            return LiteralNode(node_type="literal", code=code, value_type="timestamp", value=self._read_int64())
-        elif code == TypeMarker.TYPE_NULL:
-            return LiteralNode(node_type="literal", code=code, value_type="null", value=None)
-        else:
-            raise AILLDecodeError(f"Unknown type marker 0x{code:02X}", self._pos - 1)
+    def _decode_bool(self) -> LiteralNode:
+        """TYPE_BOOL: one of the shared _TRUE_LIT / _FALSE_LIT nodes."""
+        self._pos += 1
+        return _TRUE_LIT if self._read_uint8() else _FALSE_LIT
 
-    def _decode_struct(self) -> StructNode:
-        """Decode a BEGIN_STRUCT ... END_STRUCT."""
+    # Container and prefix handlers consume their header and return a frame
+    # for _decode_expression to fill in; see the _F_* kinds below.
+
+    def _open_struct(self) -> list:
+        """BEGIN_STRUCT ... END_STRUCT."""
         self._read_byte()  # consume BEGIN_STRUCT
-        fields = {}
-        while self._pos < len(self._data) and self._peek() != Structure.END_STRUCT:
-            if self._peek() == Structure.FIELD_SEP:
-                self._read_byte()
-                continue
-            if self._peek() == Structure.FIELD_ID:
-                self._read_byte()
-                field_code = self._read_uint16()
-                value = self._decode_expression()
-                fields[field_code] = value
-            else:
-                # Unnamed field (positional)
-                expr = self._decode_expression()
-                fields[len(fields)] = expr
-        if self._pos < len(self._data):
-            self._read_byte()  # consume END_STRUCT
-        return StructNode(node_type="struct", fields=fields)
+        return [_F_STRUCT, {}, None]
 
-    def _decode_list(self) -> ListNode:
-        """Decode a BEGIN_LIST count elements... END_LIST."""
+    def _open_list(self) -> Union[list, ListNode, ArrayLiteralNode]:
+        """BEGIN_LIST count elements... END_LIST."""
         self._read_byte()  # consume BEGIN_LIST
         count = self._read_uint16()
-        elements = []
-        for _ in range(count):
-            if self._pos >= len(self._data) or self._peek() == Structure.END_LIST:
-                break
-            elements.append(self._decode_expression())
-        if self._pos < len(self._data) and self._peek() == Structure.END_LIST:
-            self._read_byte()  # consume END_LIST
+        if self._packed_lists:
+            if count:
+                packed = self._decode_packed_list(count)
+                if packed is not None:
+                    return packed
+        elif count >= _BULK_LIST_MIN:
+            bulk = self._decode_bulk_list(count)
+            if bulk is not None:
+                return bulk
+        return [_F_LIST, [], count, count]
+
+    def _read_packed_run(self, count: int) -> Optional[tuple]:
+        """
+        Read `count` same-typed fixed-width numeric literals with one struct
+        call, returning (code, _PACKED_TYPES entry, values) and consuming a
+        trailing END_LIST. Returns None (consuming nothing) if the run is not
+        homogeneous, so the caller falls back to per-element decoding.
+        """
+        data = self._data
+        pos = self._pos
+        if pos >= len(data):
+            return None
+        code = data[pos]
+        packed = _PACKED_TYPES.get(code)
+        if packed is None:
+            return None
+        stride = packed[3] + 1
+        end = pos + count * stride
+        if end > len(data) or data[pos:end:stride] != bytes((code,)) * count:
+            return None
+        values = _packed_struct(packed[1], count).unpack_from(data, pos)
+        self._pos = end
+        if self._pos < len(data) and data[self._pos] == Structure.END_LIST:
+            self._pos += 1  # consume END_LIST
+        return code, packed, values
+
+    def _decode_packed_list(self, count: int) -> Optional[ArrayLiteralNode]:
+        """Decode a homogeneous numeric list into an ArrayLiteralNode."""
+        run = self._read_packed_run(count)
+        if run is None:
+            return None
+        code, (value_type, _, typecode, _), values = run
+        return ArrayLiteralNode(node_type="array", code=code, value_type=value_type,
+                                count=count, values=array(typecode, values))
+
+    def _decode_bulk_list(self, count: int) -> Optional[ListNode]:
+        """
+        Decode a homogeneous numeric list into the same ListNode of
+        LiteralNodes the per-element path builds, unpacking all values at once.
+        """
+        run = self._read_packed_run(count)
+        if run is None:
+            return None
+        code, (value_type, *_), values = run
+        elements = [LiteralNode("literal", code, "", value_type, v) for v in values]
         return ListNode(node_type="list", count=count, elements=elements)
 
-    def _decode_map(self) -> MapNode:
-        """Decode a BEGIN_MAP count (key value)... END_MAP."""
+    def _open_map(self) -> list:
+        """BEGIN_MAP count (key value)... END_MAP."""
         self._read_byte()  # consume BEGIN_MAP
         count = self._read_uint16()
-        pairs = []
-        for _ in range(count):
-            if self._pos >= len(self._data) or self._peek() == Structure.END_MAP:
-                break
-            key = self._decode_expression()
-            val = self._decode_expression()
-            pairs.append((key, val))
-        if self._pos < len(self._data) and self._peek() == Structure.END_MAP:
-            self._read_byte()
-        return MapNode(node_type="map", count=count, pairs=pairs)
-
-    def _decode_pragmatic(self) -> PragmaticNode:
-        """Decode a pragmatic act + expression."""
+        return [_F_MAP, [], count, count, _MORE]
+
+    def _open_pragmatic(self) -> list:
+        """A pragmatic act + expression."""
         code = self._read_byte()
-        entry = BASE_CODEBOOK.get(code)
-        act_name = entry.mnemonic if entry else f"PRAGMA_0x{code:02X}"
-        expr = self._decode_expression()
-        return PragmaticNode(node_type="pragmatic", act=act_name, expression=expr)
+        return [_F_WRAP, PragmaticNode(node_type="pragmatic", act=_MNEMONIC[code])]
 
-    def _decode_modal(self) -> ModalNode:
-        """Decode a modality + expression."""
+    def _open_modal(self) -> list:
+        """A modality + expression."""
         code = self._read_byte()
-        entry = BASE_CODEBOOK.get(code)
-        mod_name = entry.mnemonic if entry else f"MODAL_0x{code:02X}"
+        mod_name = _MNEMONIC[code]
         extra = None
         if code == Modality.PREDICTED:
             extra = self._read_float16()
         elif code == Modality.REPORTED:
             extra = self._read_uuid()
-        expr = self._decode_expression()
-        return ModalNode(node_type="modal", modality=mod_name, expression=expr, extra=extra)
+        return [_F_WRAP, ModalNode(node_type="modal", modality=mod_name, extra=extra)]
 
-    def _decode_temporal(self) -> TemporalNode:
-        """Decode a temporal modifier + expression."""
+    def _open_temporal(self) -> list:
+        """A temporal modifier + expression."""
         code = self._read_byte()
-        entry = BASE_CODEBOOK.get(code)
-        mod_name = entry.mnemonic if entry else f"TEMPORAL_0x{code:02X}"
-        expr = self._decode_expression()
-        return TemporalNode(node_type="temporal", modifier=mod_name, expression=expr)
+        return [_F_WRAP, TemporalNode(node_type="temporal", modifier=_MNEMONIC[code])]
 
-    def _decode_annotation(self) -> ASTNode:
-        """Decode an inline meta annotation."""
+    def _open_annotation(self) -> Union[list, ASTNode]:
+        """An inline meta annotation; the annotated expression is dropped."""
         code = self._read_byte()
         if code == Meta.CONFIDENCE:
             conf = self._read_float16()
-            expr = self._decode_expression()
-            return ASTNode(node_type="annotated", code=code, mnemonic=f"CONFIDENCE({conf:.2f})")
+            return [_F_DISCARD, ASTNode(node_type="annotated", code=code,
+                                        mnemonic=f"CONFIDENCE({conf:.2f})")]
         elif code == Meta.LABEL:
             label = self._read_string()
-            expr = self._decode_expression()
-            return ASTNode(node_type="annotated", code=code, mnemonic=f"LABEL({label})")
+            return [_F_DISCARD, ASTNode(node_type="annotated", code=code,
+                                        mnemonic=f"LABEL({label})")]
         return ASTNode(node_type="annotation", code=code)
 
     def _decode_domain_ref(self) -> DomainRefNode:
@@ -512,89 +807,258 @@ class AILLDecoder:
         return DomainRefNode(node_type="domain_ref", level=level, domain_code=domain_code)
 
 
+def _build_expression_dispatch() -> tuple:
+    """Build the 256-entry leading-code -> handler table for _decode_expression."""
+    table = [AILLDecoder._decode_code] * 256
+    for code in range(0x10, 0x20):
+        table[code] = AILLDecoder._decode_literal
+    table[TypeMarker.TYPE_NULL] = AILLDecoder._decode_null
+    table[TypeMarker.TYPE_BOOL] = AILLDecoder._decode_bool
+    for code in range(0x60, 0x70):
+        table[code] = AILLDecoder._open_temporal
+    for code in range(0x70, 0x80):
+        table[code] = AILLDecoder._open_modal
+    for code in range(0x80, 0x90):
+        table[code] = AILLDecoder._open_pragmatic
+    table[Meta.CONFIDENCE] = AILLDecoder._open_annotation
+    table[Meta.LABEL] = AILLDecoder._open_annotation
+    table[Meta.CONTEXT_REF] = AILLDecoder._decode_context_ref
+    table[Structure.BEGIN_STRUCT] = AILLDecoder._open_struct
+    table[Structure.BEGIN_LIST] = AILLDecoder._open_list
+    table[Structure.BEGIN_MAP] = AILLDecoder._open_map
+    for code in (Escape.ESCAPE_L1, Escape.ESCAPE_L2, Escape.ESCAPE_L3):
+        table[code] = AILLDecoder._decode_domain_ref
+    table[Escape.NOP] = AILLDecoder._skip_nop
+    table[Escape.COMMENT] = AILLDecoder._skip_comment
+    return tuple(table)
+
+_EXPRESSION_DISPATCH = _build_expression_dispatch()
+
+def _build_mnemonics() -> tuple:
+    """Base codebook mnemonic per code, with the decoder's fallback names."""
+    names = []
+    for code in range(256):
+        entry = _BASE_BY_CODE[code]
+        if entry:
+            names.append(entry.mnemonic)
+        elif 0x60 <= code < 0x70:
+            names.append(f"TEMPORAL_0x{code:02X}")
+        elif 0x70 <= code < 0x80:
+            names.append(f"MODAL_0x{code:02X}")
+        elif 0x80 <= code < 0x90:
+            names.append(f"PRAGMA_0x{code:02X}")
+        else:
+            names.append(f"UNKNOWN_0x{code:02X}")
+    return tuple(names)
+
+_MNEMONIC = _build_mnemonics()
+
+# Fixed-width numeric type marker -> (value_type, struct format, array
+# typecode, payload width) for packed list decoding
+_PACKED_TYPES = {
+    TypeMarker.TYPE_INT8:      ("int8",      'b', 'b', 1),
+    TypeMarker.TYPE_INT16:     ("int16",     'h', 'h', 2),
+    TypeMarker.TYPE_INT32:     ("int32",     'i', 'l', 4),
+    TypeMarker.TYPE_INT64:     ("int64",     'q', 'q', 8),
+    TypeMarker.TYPE_UINT8:     ("uint8",     'B', 'B', 1),
+    TypeMarker.TYPE_UINT16:    ("uint16",    'H', 'H', 2),
+    TypeMarker.TYPE_UINT32:    ("uint32",    'I', 'L', 4),
+    TypeMarker.TYPE_UINT64:    ("uint64",    'Q', 'Q', 8),
+    TypeMarker.TYPE_FLOAT16:   ("float16",   'e', 'f', 2),
+    TypeMarker.TYPE_FLOAT32:   ("float32",   'f', 'f', 4),
+    TypeMarker.TYPE_FLOAT64:   ("float64",   'd', 'd', 8),
+    TypeMarker.TYPE_TIMESTAMP: ("timestamp", 'q', 'q', 8),
+}
+
+# Shorter numeric lists are cheaper to decode element by element
+_BULK_LIST_MIN = 8
+
+# A Struct's size grows with its item count, and list counts come off the
+# wire, so only Structs for short runs are cached
+_PACKED_CACHE_MAX_COUNT = 64
+
+@lru_cache(maxsize=64)
+def _cached_packed_struct(fmt: str, count: int) -> struct.Struct:
+    return struct.Struct('>' + ('x' + fmt) * count)
+
+def _packed_struct(fmt: str, count: int) -> struct.Struct:
+    """Struct for `count` (marker, value) pairs, skipping the markers."""
+    if count <= _PACKED_CACHE_MAX_COUNT:
+        return _cached_packed_struct(fmt, count)
+    return struct.Struct('>' + ('x' + fmt) * count)
+
+# Type marker -> (value_type, reader) dispatch table for _decode_literal
+_LITERAL_TABLE = {
+    TypeMarker.TYPE_INT8:      ("int8",      AILLDecoder._read_int8),
+    TypeMarker.TYPE_INT16:     ("int16",     AILLDecoder._read_int16),
+    TypeMarker.TYPE_INT32:     ("int32",     AILLDecoder._read_int32),
+    TypeMarker.TYPE_INT64:     ("int64",     AILLDecoder._read_int64),
+    TypeMarker.TYPE_UINT8:     ("uint8",     AILLDecoder._read_uint8),
+    TypeMarker.TYPE_UINT16:    ("uint16",    AILLDecoder._read_uint16),
+    TypeMarker.TYPE_UINT32:    ("uint32",    AILLDecoder._read_uint32),
+    TypeMarker.TYPE_UINT64:    ("uint64",    AILLDecoder._read_uint64),
+    TypeMarker.TYPE_FLOAT16:   ("float16",   AILLDecoder._read_float16),
+    TypeMarker.TYPE_FLOAT32:   ("float32",   AILLDecoder._read_float32),
+    TypeMarker.TYPE_FLOAT64:   ("float64",   AILLDecoder._read_float64),
+    TypeMarker.TYPE_BOOL:      ("bool",      lambda d: d._read_uint8() != 0),
+    TypeMarker.TYPE_STRING:    ("string",    AILLDecoder._read_string),
+    TypeMarker.TYPE_BYTES:     ("bytes",     lambda d: d._read_bytes(d._read_uint16())),
+    TypeMarker.TYPE_TIMESTAMP: ("timestamp", AILLDecoder._read_int64),
+    TypeMarker.TYPE_NULL:      ("null",      lambda d: None),
+}
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Pretty Printer
 # ═══════════════════════════════════════════════════════════════════════
 
 def pretty_print(node: ASTNode, indent: int = 0, domain_codebooks=None) -> str:
     """Produce a human-readable representation of a decoded AILL AST."""
-    prefix = "  " * indent
-    lines = []
-
-    if isinstance(node, UtteranceNode):
-        lines.append(f"{prefix}UTTERANCE:")
-        lines.append(pretty_print(node.meta, indent + 1, domain_codebooks))
-        lines.append(f"{prefix}  BODY:")
-        for expr in node.body:
-            lines.append(pretty_print(expr, indent + 2, domain_codebooks))
-
-    elif isinstance(node, MetaHeaderNode):
-        lines.append(f"{prefix}META: confidence={node.confidence:.2f} priority={node.priority} "
-                     f"timestamp={node.timestamp_us}")
-        if node.dest_agent:
-            lines.append(f"{prefix}  dest_agent={node.dest_agent.hex()}")
-        if node.seqnum is not None:
-            lines.append(f"{prefix}  seqnum={node.seqnum}")
-
-    elif isinstance(node, PragmaticNode):
-        lines.append(f"{prefix}{node.act}:")
-        if node.expression:
-            lines.append(pretty_print(node.expression, indent + 1, domain_codebooks))
-
-    elif isinstance(node, ModalNode):
-        extra_str = f" (horizon={node.extra}ms)" if node.extra else ""
-        lines.append(f"{prefix}[{node.modality}{extra_str}]:")
-        if node.expression:
-            lines.append(pretty_print(node.expression, indent + 1, domain_codebooks))
-
-    elif isinstance(node, TemporalNode):
-        lines.append(f"{prefix}<{node.modifier}>:")
-        if node.expression:
-            lines.append(pretty_print(node.expression, indent + 1, domain_codebooks))
-
-    elif isinstance(node, LiteralNode):
-        lines.append(f"{prefix}{node.value_type}: {node.value}")
-
-    elif isinstance(node, StructNode):
-        lines.append(f"{prefix}STRUCT:")
-        for fid, val in node.fields.items():
-            field_label = f"field_0x{fid:04X}" if isinstance(fid, int) else str(fid)
-            # Try to resolve field name from domain codebooks
-            if domain_codebooks and isinstance(fid, int):
-                for cb in domain_codebooks.values():
-                    entry = cb.lookup(fid)
-                    if entry:
-                        field_label = entry.mnemonic
-                        break
-            lines.append(f"{prefix}  {field_label}:")
-            lines.append(pretty_print(val, indent + 2, domain_codebooks))
-
-    elif isinstance(node, ListNode):
-        lines.append(f"{prefix}LIST[{node.count}]:")
-        for elem in node.elements:
-            lines.append(pretty_print(elem, indent + 1, domain_codebooks))
-
-    elif isinstance(node, MapNode):
-        lines.append(f"{prefix}MAP[{node.count}]:")
-        for k, v in node.pairs:
-            lines.append(f"{prefix}  key: {pretty_print(k, 0, domain_codebooks).strip()}")
-            lines.append(f"{prefix}  val: {pretty_print(v, 0, domain_codebooks).strip()}")
-
-    elif isinstance(node, DomainRefNode):
-        level_names = {1: "L1", 2: "L2", 3: "L3"}
-        label = f"DOMAIN_0x{node.domain_code:04X}"
-        if domain_codebooks:
-            for cb in domain_codebooks.values():
-                entry = cb.lookup(node.domain_code)
-                if entry:
-                    label = f"{cb.name}:{entry.mnemonic}"
-                    break
-        lines.append(f"{prefix}REF({level_names.get(node.level, '?')}: {label})")
-
-    elif isinstance(node, ContextRefNode):
-        lines.append(f"{prefix}SCT_REF[{node.sct_index}]")
-
-    elif isinstance(node, ASTNode):
-        lines.append(f"{prefix}{node.mnemonic or f'CODE_0x{node.code:02X}'}")
-
-    return "\n".join(lines)
+    out = []
+    names = _codebook_index(domain_codebooks) if domain_codebooks else None
+    _pp(node, indent, names, out)
+    return "\n".join(out)
+
+
+# pretty_print appends every line to one shared list and joins once at the
+# end; each _pp_* handler renders one node type at the given indent level.
+# Handlers get `names`, a flat code -> (codebook name, mnemonic) index of the
+# caller's domain codebooks (or None), instead of the codebooks themselves.
+
+def _codebook_index(domain_codebooks) -> dict[int, tuple[str, str]]:
+    """Map each domain code to its first (name, mnemonic) across the codebooks."""
+    index = {}
+    for cb in domain_codebooks.values():
+        for code, entry in cb.entries.items():
+            if code not in index:
+                index[code] = (cb.name, entry.mnemonic)
+    return index
+
+_INDENT = ["  " * i for i in range(16)]
+
+def _prefix(indent: int) -> str:
+    while indent >= len(_INDENT):
+        _INDENT.append("  " * len(_INDENT))
+    return _INDENT[indent]
+
+def _pp(node, indent: int, names, out: list) -> None:
+    handler = _PP_DISPATCH.get(node.__class__)
+    if handler is None:
+        handler = _pp_resolve(node.__class__)
+    handler(node, indent, names, out)
+
+def _pp_utterance(node, indent, names, out):
+    prefix = _prefix(indent)
+    out.append(f"{prefix}UTTERANCE:")
+    _pp(node.meta, indent + 1, names, out)
+    out.append(f"{prefix}  BODY:")
+    for expr in node.body:
+        _pp(expr, indent + 2, names, out)
+
+def _pp_meta(node, indent, names, out):
+    prefix = _prefix(indent)
+    out.append(f"{prefix}META: confidence={node.confidence:.2f} priority={node.priority} "
+               f"timestamp={node.timestamp_us}")
+    if node.dest_agent:
+        out.append(f"{prefix}  dest_agent={node.dest_agent.hex()}")
+    if node.seqnum is not None:
+        out.append(f"{prefix}  seqnum={node.seqnum}")
+
+def _pp_pragmatic(node, indent, names, out):
+    out.append(f"{_prefix(indent)}{node.act}:")
+    if node.expression:
+        _pp(node.expression, indent + 1, names, out)
+
+def _pp_modal(node, indent, names, out):
+    extra_str = f" (horizon={node.extra}ms)" if node.extra else ""
+    out.append(f"{_prefix(indent)}[{node.modality}{extra_str}]:")
+    if node.expression:
+        _pp(node.expression, indent + 1, names, out)
+
+def _pp_temporal(node, indent, names, out):
+    out.append(f"{_prefix(indent)}<{node.modifier}>:")
+    if node.expression:
+        _pp(node.expression, indent + 1, names, out)
+
+def _pp_literal(node, indent, names, out):
+    value = bytes(node.value) if isinstance(node.value, memoryview) else node.value
+    out.append(f"{_prefix(indent)}{node.value_type}: {value}")
+
+def _pp_struct(node, indent, names, out):
+    prefix = _prefix(indent)
+    out.append(f"{prefix}STRUCT:")
+    for fid, val in node.fields.items():
+        field_label = f"field_0x{fid:04X}" if isinstance(fid, int) else str(fid)
+        # Try to resolve field name from domain codebooks
+        if names and isinstance(fid, int):
+            hit = names.get(fid)
+            if hit:
+                field_label = hit[1]
+        out.append(f"{prefix}  {field_label}:")
+        _pp(val, indent + 2, names, out)
+
+def _pp_list(node, indent, names, out):
+    out.append(f"{_prefix(indent)}LIST[{node.count}]:")
+    for elem in node.elements:
+        _pp(elem, indent + 1, names, out)
+
+def _pp_array(node, indent, names, out):
+    out.append(f"{_prefix(indent)}ARRAY<{node.value_type}>[{node.count}]: {node.values.tolist()}")
+
+def _pp_map(node, indent, names, out):
+    prefix = _prefix(indent)
+    out.append(f"{prefix}MAP[{node.count}]:")
+    for k, v in node.pairs:
+        # Keys and values are rendered flush-left and inlined after the label
+        for label, item in (("key", k), ("val", v)):
+            sub = []
+            _pp(item, 0, names, sub)
+            text = "\n".join(sub).strip()
+            out.append(f"{prefix}  {label}: {text}")
+
+def _pp_domain_ref(node, indent, names, out):
+    level_names = {1: "L1", 2: "L2", 3: "L3"}
+    label = f"DOMAIN_0x{node.domain_code:04X}"
+    if names:
+        hit = names.get(node.domain_code)
+        if hit:
+            label = f"{hit[0]}:{hit[1]}"
+    out.append(f"{_prefix(indent)}REF({level_names.get(node.level, '?')}: {label})")
+
+def _pp_context_ref(node, indent, names, out):
+    out.append(f"{_prefix(indent)}SCT_REF[{node.sct_index}]")
+
+def _pp_code(node, indent, names, out):
+    out.append(f"{_prefix(indent)}{node.mnemonic or f'CODE_0x{node.code:02X}'}")
+
+def _pp_empty(node, indent, names, out):
+    # None (skipped NOP/COMMENT) and non-AST values render as a blank line
+    out.append("")
+
+_PP_DISPATCH = {
+    UtteranceNode: _pp_utterance,
+    MetaHeaderNode: _pp_meta,
+    PragmaticNode: _pp_pragmatic,
+    ModalNode: _pp_modal,
+    TemporalNode: _pp_temporal,
+    LiteralNode: _pp_literal,
+    StructNode: _pp_struct,
+    ListNode: _pp_list,
+    ArrayLiteralNode: _pp_array,
+    MapNode: _pp_map,
+    DomainRefNode: _pp_domain_ref,
+    ContextRefNode: _pp_context_ref,
+    ASTNode: _pp_code,
+    type(None): _pp_empty,
+}
+
+def _pp_resolve(cls: type):
+    """Handler for a type not in _PP_DISPATCH: nearest registered base class."""
+    for base in cls.__mro__:
+        if base in _PP_DISPATCH:
+            handler = _PP_DISPATCH[base]
+            break
+    else:
+        handler = _pp_empty
+    _PP_DISPATCH[cls] = handler
+    return handler
@@ -9,13 +9,15 @@ specified in Part IV of the supplemental specification.
 import struct
 import time
 import math
-from typing import Union, Optional
+import operator
+from functools import lru_cache
+from typing import Any, Iterable, Union, Optional
 from dataclasses import dataclass, field
 
 from .codebook import (
     FrameControl, TypeMarker, Structure, Quantifier, Logic, Relational,
     Temporal, Modality, Pragmatic, Meta, Arithmetic, Escape,
-    BINARY_OPS, UNARY_OPS, TERNARY_OPS,
+    BINARY_OPS, UNARY_OPS, TERNARY_OPS, DomainEntry,
 )
 
 
@@ -34,11 +36,35 @@ for i in range(256):
         crc &= 0xFF
     _CRC8_TABLE.append(crc)
 
+# x has multiplicative order 127 modulo the CRC polynomial, so (with a zero
+# initial value) shifting a message by a multiple of 127 bits leaves its
+# CRC unchanged. Long inputs can therefore be XOR-folded down to a single
+# 127-bit block - using big-int arithmetic, i.e. C loops - leaving only 16
+# bytes for the table-driven byte loop.
+_CRC8_PERIOD = 127
+_CRC8_FOLD_MIN = 80  # below this the plain byte loop is faster
+
+def _crc8_fold(data: bytes) -> bytes:
+    """Reduce data to a 16-byte block with the same CRC-8."""
+    period = _CRC8_PERIOD
+    x = int.from_bytes(data, 'big')
+    blocks = (x.bit_length() + period - 1) // period
+    while blocks > 1:
+        # XOR the upper blocks onto the lower half, keeping block alignment
+        half = blocks // 2
+        shift = half * period
+        x = (x >> shift) ^ (x & ((1 << shift) - 1))
+        blocks -= half
+    return x.to_bytes(16, 'big')
+
 def crc8(data: bytes) -> int:
     """Compute CRC-8/CCITT over a byte sequence."""
+    if len(data) >= _CRC8_FOLD_MIN:
+        data = _crc8_fold(data)
+    table = _CRC8_TABLE   # local for the loop
     crc = 0x00
     for b in data:
-        crc = _CRC8_TABLE[crc ^ b]
+        crc = table[crc ^ b]
     return crc
 
 
@@ -46,71 +72,106 @@ def crc8(data: bytes) -> int:
 # Float16 helpers (IEEE 754 binary16)
 # ═══════════════════════════════════════════════════════════════════════
 
+# Precompiled big-endian packers, shared by the helpers and ByteStream
+_I8 = struct.Struct('>b')
+_U16 = struct.Struct('>H')
+_I16 = struct.Struct('>h')
+_U32 = struct.Struct('>I')
+_I32 = struct.Struct('>i')
+_U64 = struct.Struct('>Q')
+_I64 = struct.Struct('>q')
+_F16 = struct.Struct('>e')
+_F32 = struct.Struct('>f')
+_F64 = struct.Struct('>d')
+
 def encode_float16(value: float) -> bytes:
     """Encode a Python float as IEEE 754 binary16 (2 bytes, big-endian)."""
-    return struct.pack('>e', value)
+    return _F16.pack(value)
 
 def decode_float16(data: bytes) -> float:
     """Decode 2 bytes (big-endian) as IEEE 754 binary16."""
-    return struct.unpack('>e', data)[0]
+    return _F16.unpack(data)[0]
 
 def encode_float32(value: float) -> bytes:
-    return struct.pack('>f', value)
+    return _F32.pack(value)
 
 def decode_float32(data: bytes) -> float:
-    return struct.unpack('>f', data)[0]
+    return _F32.unpack(data)[0]
+
+# float32_class() results
+FLOAT32_FINITE, FLOAT32_POS_INF, FLOAT32_NEG_INF, FLOAT32_NAN = range(4)
+
+def float32_class(value: float) -> int:
+    """Classify a value's float32 encoding from its bit pattern."""
+    bits = _U32.unpack(_F32.pack(value))[0]
+    if bits & 0x7F800000 != 0x7F800000:
+        return FLOAT32_FINITE
+    if bits & 0x007FFFFF:
+        return FLOAT32_NAN
+    return FLOAT32_NEG_INF if bits >> 31 else FLOAT32_POS_INF
 
 def encode_float64(value: float) -> bytes:
-    return struct.pack('>d', value)
+    return _F64.pack(value)
 
 def decode_float64(data: bytes) -> float:
-    return struct.unpack('>d', data)[0]
+    return _F64.unpack(data)[0]
 
 
 # ═══════════════════════════════════════════════════════════════════════
 # VarInt encoding
 # ═══════════════════════════════════════════════════════════════════════
 
+# Encoded length indexed by value.bit_length() (0-32), and the length-prefix
+# bits for each length; OR-ing the prefix onto the value gives the encoding.
+_VARINT_SIZE = bytes([1] * 8 + [2] * 7 + [3] * 7 + [4] * 7 + [5] * 4)
+_VARINT_PREFIX = (0, 0, 0x8000, 0xC00000, 0xE0000000, 0xF000000000)
+
 def encode_varint(value: int) -> bytes:
     """Encode a non-negative integer as a variable-length integer."""
     if value < 0:
         raise ValueError("VarInt does not support negative values")
-    if value < 128:
-        return bytes([value])
-    elif value < 16384:
-        return bytes([0x80 | (value >> 8), value & 0xFF])
-    elif value < 2097152:
-        return bytes([0xC0 | (value >> 16), (value >> 8) & 0xFF, value & 0xFF])
-    elif value < 268435456:
-        return bytes([0xE0 | (value >> 24), (value >> 16) & 0xFF,
-                      (value >> 8) & 0xFF, value & 0xFF])
-    else:
-        return bytes([0xF0]) + struct.pack('>I', value)
+    if value < 0x80:
+        return bytes((value,))
+    try:
+        n = _VARINT_SIZE[value.bit_length()]
+    except IndexError:
+        return b'\xf0' + _U32.pack(value)  # raises struct.error: too large
+    return (value | _VARINT_PREFIX[n]).to_bytes(n, 'big')
+
+# Encoded length (1-5) indexed by the first VarInt byte, and the value
+# mask for each length; decoding is a table lookup instead of a ladder.
+_VARINT_LEN = bytes([1] * 0x80 + [2] * 0x40 + [3] * 0x20 + [4] * 0x10 + [5] * 0x10)
+_VARINT_MASK = (0, 0x7F, 0x3FFF, 0x1FFFFF, 0x0FFFFFFF, 0xFFFFFFFF)
 
 def decode_varint(data: bytes, offset: int = 0) -> tuple[int, int]:
     """Decode a VarInt, returning (value, bytes_consumed)."""
     first = data[offset]
     if first < 0x80:
         return first, 1
-    elif first < 0xC0:
-        val = ((first & 0x3F) << 8) | data[offset + 1]
-        return val, 2
-    elif first < 0xE0:
-        val = ((first & 0x1F) << 16) | (data[offset + 1] << 8) | data[offset + 2]
-        return val, 3
-    elif first < 0xF0:
-        val = ((first & 0x0F) << 24) | (data[offset + 1] << 16) | \
-              (data[offset + 2] << 8) | data[offset + 3]
-        return val, 4
-    else:
-        val = struct.unpack('>I', data[offset + 1:offset + 5])[0]
-        return val, 5
+    n = _VARINT_LEN[first]
+    end = offset + n
+    if end > len(data):
+        raise ValueError(f"Truncated VarInt: need {n} bytes at offset {offset}")
+    return int.from_bytes(data[offset:end], 'big') & _VARINT_MASK[n], n
 
 
 # ═══════════════════════════════════════════════════════════════════════
 # Byte Stream Builder
 # ═══════════════════════════════════════════════════════════════════════
 
+_LIST_CACHE_MAX_COUNT = 64
+
+@lru_cache(maxsize=256)
+def _cached_list_struct(fmt: str, count: int) -> struct.Struct:
+    return struct.Struct('>BH' + ('B' + fmt) * count + 'B')
+
+def _list_struct(fmt: str, count: int) -> struct.Struct:
+    """Struct for a whole typed list: BEGIN_LIST, count, `count` (type
+    marker, value) pairs of one scalar format, END_LIST."""
+    if count <= _LIST_CACHE_MAX_COUNT:
+        return _cached_list_struct(fmt, count)
+    return struct.Struct('>BH' + ('B' + fmt) * count + 'B')
+
 class ByteStream:
     """Builds a byte sequence by appending typed values."""
 
@@ -126,43 +187,43 @@ class ByteStream:
         return self
 
     def write_int8(self, val: int) -> 'ByteStream':
-        self._buf.extend(struct.pack('>b', val))
+        self._buf.extend(_I8.pack(val))
         return self
 
     def write_uint16(self, val: int) -> 'ByteStream':
-        self._buf.extend(struct.pack('>H', val))
+        self._buf.extend(_U16.pack(val))
         return self
 
     def write_int16(self, val: int) -> 'ByteStream':
-        self._buf.extend(struct.pack('>h', val))
+        self._buf.extend(_I16.pack(val))
         return self
 
     def write_uint32(self, val: int) -> 'ByteStream':
-        self._buf.extend(struct.pack('>I', val))
+        self._buf.extend(_U32.pack(val))
         return self
 
     def write_int32(self, val: int) -> 'ByteStream':
-        self._buf.extend(struct.pack('>i', val))
+        self._buf.extend(_I32.pack(val))
         return self
 
     def write_int64(self, val: int) -> 'ByteStream':
-        self._buf.extend(struct.pack('>q', val))
+        self._buf.extend(_I64.pack(val))
         return self
 
     def write_uint64(self, val: int) -> 'ByteStream':
-        self._buf.extend(struct.pack('>Q', val))
+        self._buf.extend(_U64.pack(val))
         return self
 
     def write_float16(self, val: float) -> 'ByteStream':
-        self._buf.extend(encode_float16(val))
+        self._buf.extend(_F16.pack(val))
         return self
 
     def write_float32(self, val: float) -> 'ByteStream':
-        self._buf.extend(encode_float32(val))
+        self._buf.extend(_F32.pack(val))
         return self
 
     def write_float64(self, val: float) -> 'ByteStream':
-        self._buf.extend(encode_float64(val))
+        self._buf.extend(_F64.pack(val))
         return self
 
     def write_string(self, val: str) -> 'ByteStream':
@@ -178,12 +239,24 @@ class ByteStream:
 
     def write_uuid(self, val: bytes) -> 'ByteStream':
         """Write a 128-bit UUID (16 bytes)."""
-        assert len(val) == 16, "UUID must be 16 bytes"
-        self._buf.extend(val)
+        # An explicit check rather than assert, which -O would strip; a
+        # '16s' Struct is no help as it silently pads or truncates
+        if len(val) != 16:
+            raise ValueError("UUID must be 16 bytes")
+        self._buf += val
         return self
 
     def write_varint(self, val: int) -> 'ByteStream':
-        self._buf.extend(encode_varint(val))
+        if 0 <= val < 0x80:
+            self._buf.append(val)
+            return self
+        if val < 0:
+            raise ValueError("VarInt does not support negative values")
+        try:
+            n = _VARINT_SIZE[val.bit_length()]
+        except IndexError:
+            return self.write_raw(encode_varint(val))  # out of range: same error
+        self._buf.extend((val | _VARINT_PREFIX[n]).to_bytes(n, 'big'))
         return self
 
     def write_raw(self, data: bytes) -> 'ByteStream':
@@ -193,6 +266,18 @@ class ByteStream:
     def to_bytes(self) -> bytes:
         return bytes(self._buf)
 
+    def to_memoryview(self) -> memoryview:
+        """
+        Zero-copy view of the bytes written so far. The stream cannot grow
+        while the view is alive; release() it before writing again.
+        """
+        return memoryview(self._buf)
+
+    def clear(self) -> 'ByteStream':
+        """Drop the contents so the stream can be reused."""
+        self._buf.clear()
+        return self
+
     def __len__(self):
         return len(self._buf)
 
@@ -203,58 +288,185 @@ class ByteStream:
 
 MAX_EPOCH_PAYLOAD = 8192
 
+# Epoch header: sequence number, payload length
+_EPOCH_HDR = struct.Struct('>HH')
+# Header slot plus the largest payload an epoch may carry
+_EPOCH_MAX_LEN = _EPOCH_HDR.size + MAX_EPOCH_PAYLOAD
+
 class EpochBuilder:
     """Builds epochs with sequence numbers and CRC-8 checksums."""
 
     def __init__(self):
         self._seq = 0
-        self._epochs: list[bytes] = []
-        self._current_payload = ByteStream()
+        # Finished epochs back to back in one buffer, with their start offsets
+        self._out = bytearray()
+        self._epoch_offsets: list[int] = []
+        # The epoch is assembled in place: a header slot, back-patched at
+        # flush time, followed by the payload
+        self._current_payload = ByteStream().write_raw(bytes(_EPOCH_HDR.size))
+        # The backing bytearray, so the hot write path avoids ByteStream calls
+        self._buf = self._current_payload._buf
 
     def write(self, data: bytes):
         """Add data to the current epoch. Flushes if size exceeded."""
-        if len(self._current_payload) + len(data) > MAX_EPOCH_PAYLOAD:
+        buf = self._buf
+        if len(buf) + len(data) > _EPOCH_MAX_LEN:
             self.flush()
-        self._current_payload.write_raw(data)
+        buf += data
+
+    def _payload_len(self) -> int:
+        return len(self._buf) - _EPOCH_HDR.size
 
     def flush(self):
         """Finalize the current epoch and start a new one."""
-        if len(self._current_payload) == 0:
+        buf = self._buf
+        payload_len = len(buf) - _EPOCH_HDR.size
+        if payload_len == 0:
             return
-        payload = self._current_payload.to_bytes()
-        epoch = ByteStream()
-        epoch.write_uint16(self._seq)
-        epoch.write_uint16(len(payload))
-        epoch.write_raw(payload)
+        _EPOCH_HDR.pack_into(buf, 0, self._seq, payload_len)
         # CRC-8 over (seq + length + payload)
-        epoch_bytes = epoch.to_bytes()
-        checksum = crc8(epoch_bytes)
-        epoch.write_uint8(checksum)
-        self._epochs.append(epoch.to_bytes())
+        buf.append(crc8(buf))
+        self._epoch_offsets.append(len(self._out))
+        self._out += buf
         self._seq += 1
-        self._current_payload = ByteStream()
+        del buf[_EPOCH_HDR.size:]
+
+    def _epoch_bounds(self):
+        offsets = self._epoch_offsets
+        return zip(offsets, offsets[1:] + [len(self._out)])
 
     def get_epochs(self) -> list[bytes]:
         self.flush()
-        return self._epochs
+        out = self._out
+        return [bytes(out[start:end]) for start, end in self._epoch_bounds()]
+
+    def get_epochs_view(self) -> list[memoryview]:
+        """Return each epoch as a view into the shared output buffer.
+
+        The views must be released before further writes can be flushed.
+        """
+        self.flush()
+        out = memoryview(self._out)
+        return [out[start:end] for start, end in self._epoch_bounds()]
+
+    def get_stream_bytes(self) -> bytes:
+        """Return all epochs concatenated, as sent on the wire."""
+        self.flush()
+        return bytes(self._out)
 
     @property
     def epoch_count(self):
-        return len(self._epochs) + (1 if len(self._current_payload) > 0 else 0)
+        return len(self._epoch_offsets) + (1 if self._payload_len() > 0 else 0)
 
 
 # ═══════════════════════════════════════════════════════════════════════
 # High-Level Encoder (Expression → Bytes)
 # ═══════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AILLValue:
     """Represents a typed AILL value for encoding."""
     type_code: int       # TypeMarker enum value
-    value: any           # Python value
+    value: Any           # Python value
     semantic_tag: Optional[int] = None  # Optional domain codebook code
 
 
+# START_UTTERANCE, CONFIDENCE f16, PRIORITY u8, TIMESTAMP_META i64
+_UTTERANCE_HEADER = struct.Struct('>BBeBBBq')
+
+# Whole utterance for emit_assert_int8: the header above, then ASSERT,
+# TYPE_INT8 value, END_UTTERANCE
+_ASSERT_INT8_UTTERANCE = struct.Struct('>BBeBBBqBBbB')
+
+# FIELD_ID, field code, type marker, value - for the fused field_* builders
+_FIELD_F16 = struct.Struct('>BHBe')
+_FIELD_F32 = struct.Struct('>BHBf')
+_FIELD_I16 = struct.Struct('>BHBh')
+_FIELD_U8 = struct.Struct('>BHBB')
+_FIELD_U16 = struct.Struct('>BHBH')
+
+# Struct format and type marker for each scalar type a schema field may carry
+_SCHEMA_TYPES = {
+    'int8': ('b', TypeMarker.TYPE_INT8),
+    'int16': ('h', TypeMarker.TYPE_INT16),
+    'int32': ('i', TypeMarker.TYPE_INT32),
+    'int64': ('q', TypeMarker.TYPE_INT64),
+    'uint8': ('B', TypeMarker.TYPE_UINT8),
+    'uint16': ('H', TypeMarker.TYPE_UINT16),
+    'uint32': ('I', TypeMarker.TYPE_UINT32),
+    'float16': ('e', TypeMarker.TYPE_FLOAT16),
+    'float32': ('f', TypeMarker.TYPE_FLOAT32),
+    'float64': ('d', TypeMarker.TYPE_FLOAT64),
+}
+
+@lru_cache(maxsize=128)
+def _compile_schema(fields: tuple):
+    """Generate encode(enc, *values) for a schema as one struct.pack call."""
+    fmt = ['>B']
+    args = [int(Structure.BEGIN_STRUCT)]
+    params = []
+
+    def value(code_fmt, marker):
+        fmt.append('B' + code_fmt)
+        params.append(f'v{len(params)}')
+        args.extend((int(marker), params[-1]))
+
+    for spec in fields:
+        field_code, type_name, *count = spec
+        field_code = operator.index(field_code)
+        if type_name not in _SCHEMA_TYPES:
+            raise ValueError(f"Unsupported schema field type: {type_name!r}")
+        if not 0 <= field_code <= 0xFFFF:
+            raise ValueError(f"Field code out of range: {field_code}")
+        code_fmt, marker = _SCHEMA_TYPES[type_name]
+        fmt.append('BH')
+        args.extend((int(Structure.FIELD_ID), field_code))
+        if not count:
+            value(code_fmt, marker)
+            continue
+        n = operator.index(count[0])
+        if not 0 <= n <= 0xFFFF:
+            raise ValueError(f"List length out of range: {n}")
+        fmt.append('BH')
+        args.extend((int(Structure.BEGIN_LIST), n))
+        for _ in range(n):
+            value(code_fmt, marker)
+        fmt.append('B')
+        args.append(int(Structure.END_LIST))
+    fmt.append('B')
+    args.append(int(Structure.END_STRUCT))
+
+    # Field codes and counts went through operator.index() above, so only
+    # generated parameter names and %d-formatted integers reach the source
+    consts = [a if isinstance(a, str) else '%d' % a for a in args]
+    src = (f"def encode(enc, {', '.join(params)}):\n"
+           f"    return enc.raw(_pack({', '.join(consts)}))\n")
+    namespace = {'_pack': struct.Struct(''.join(fmt)).pack}
+    exec(src, namespace)
+    return namespace['encode']
+
+
+class AILLSchema:
+    """
+    A fixed struct layout compiled once into a single struct.pack call.
+
+    Each field is (field_code, type_name) for a scalar or
+    (field_code, type_name, count) for a fixed-length typed list, with type
+    names as in the AILLEncoder methods. encode() takes the values in field
+    order and writes the same bytes as the equivalent chain:
+
+        POSITION = AILLSchema([(0x0000, 'float32', 3),
+                               (0x0002, 'float32'), (0x0006, 'float32')])
+        POSITION.encode(encoder, x, y, z, heading, speed)
+    """
+    __slots__ = ('fields', 'encode')
+
+    def __init__(self, fields):
+        self.fields = tuple(tuple(f) for f in fields)
+        # Compiled encoders are shared between schemas with equal fields
+        self.encode = _compile_schema(self.fields)
+
+
 class AILLEncoder:
     """
     Encodes AILL utterances into wire format bytes.
@@ -286,17 +498,15 @@ class AILLEncoder:
                         seqnum: Optional[int] = None) -> 'AILLEncoder':
         """Begin a new utterance with mandatory meta header."""
         if timestamp_us is None:
-            timestamp_us = int(time.time() * 1_000_000)
-
-        self._code(FrameControl.START_UTTERANCE)
+            timestamp_us = time.time_ns() // 1000
 
-        # Mandatory meta header: CONFIDENCE, PRIORITY, TIMESTAMP
-        self._code(Meta.CONFIDENCE)
-        self._stream.write_float16(confidence)
-        self._code(Meta.PRIORITY)
-        self._stream.write_uint8(priority)
-        self._code(Meta.TIMESTAMP_META)
-        self._stream.write_int64(timestamp_us)
+        # START_UTTERANCE + mandatory meta header (CONFIDENCE, PRIORITY,
+        # TIMESTAMP) in one fixed-layout pack
+        self._stream.write_raw(_UTTERANCE_HEADER.pack(
+            FrameControl.START_UTTERANCE,
+            Meta.CONFIDENCE, confidence,
+            Meta.PRIORITY, priority & 0xFF,
+            Meta.TIMESTAMP_META, timestamp_us))
 
         # Optional meta fields
         if dest_agent is not None:
@@ -310,11 +520,53 @@ class AILLEncoder:
         return self
 
     def end_utterance(self) -> bytes:
-        """End the utterance and return the complete wire bytes."""
+        """End the utterance and return the complete wire bytes (a copy)."""
         self._code(FrameControl.END_UTTERANCE)
         self._in_utterance = False
         return self._stream.to_bytes()
 
+    def end_utterance_view(self) -> memoryview:
+        """
+        End the utterance and return a zero-copy view of the wire bytes.
+        The view aliases the encoder's buffer; release() it before the next
+        reset() to let that buffer be reused.
+        """
+        self._code(FrameControl.END_UTTERANCE)
+        self._in_utterance = False
+        return self._stream.to_memoryview()
+
+    @staticmethod
+    def emit_assert_int8(val: int, confidence: float = 1.0, priority: int = 3,
+                         timestamp_us: Optional[int] = None) -> bytes:
+        """
+        Return a complete ASSERT-one-INT8 utterance from a single template
+        pack; the same bytes as start_utterance(...).assert_().int8(val)
+        .end_utterance(). Uses no encoder state: the bytes are returned
+        directly and bypass any instance's stream, so they never join an
+        utterance being built there.
+        """
+        if timestamp_us is None:
+            timestamp_us = time.time_ns() // 1000
+        return _ASSERT_INT8_UTTERANCE.pack(
+            FrameControl.START_UTTERANCE,
+            Meta.CONFIDENCE, confidence,
+            Meta.PRIORITY, priority & 0xFF,
+            Meta.TIMESTAMP_META, timestamp_us,
+            Pragmatic.ASSERT, TypeMarker.TYPE_INT8, val,
+            FrameControl.END_UTTERANCE)
+
+    def reset(self, agent_uuid: Optional[bytes] = None) -> 'AILLEncoder':
+        """Discard any encoded bytes so the encoder can start a new utterance."""
+        try:
+            self._stream.clear()
+        except BufferError:
+            # A view from end_utterance_view() is still alive; leave it intact
+            self._stream = ByteStream()
+        self._in_utterance = False
+        if agent_uuid is not None:
+            self._uuid = agent_uuid
+        return self
+
     # ── Pragmatic acts ──
     def pragma(self, act: Pragmatic) -> 'AILLEncoder':
         return self._code(act)
@@ -368,6 +620,32 @@ class AILLEncoder:
         self._stream.write_uint16(field_code)
         return self
 
+    # Fused FIELD_ID + typed scalar, equivalent to .field(code).<type>(val)
+    def field_f16(self, field_code: int, val: float) -> 'AILLEncoder':
+        self._stream.write_raw(_FIELD_F16.pack(
+            Structure.FIELD_ID, field_code, TypeMarker.TYPE_FLOAT16, val))
+        return self
+
+    def field_f32(self, field_code: int, val: float) -> 'AILLEncoder':
+        self._stream.write_raw(_FIELD_F32.pack(
+            Structure.FIELD_ID, field_code, TypeMarker.TYPE_FLOAT32, val))
+        return self
+
+    def field_i16(self, field_code: int, val: int) -> 'AILLEncoder':
+        self._stream.write_raw(_FIELD_I16.pack(
+            Structure.FIELD_ID, field_code, TypeMarker.TYPE_INT16, val))
+        return self
+
+    def field_u8(self, field_code: int, val: int) -> 'AILLEncoder':
+        self._stream.write_raw(_FIELD_U8.pack(
+            Structure.FIELD_ID, field_code, TypeMarker.TYPE_UINT8, val & 0xFF))
+        return self
+
+    def field_u16(self, field_code: int, val: int) -> 'AILLEncoder':
+        self._stream.write_raw(_FIELD_U16.pack(
+            Structure.FIELD_ID, field_code, TypeMarker.TYPE_UINT16, val))
+        return self
+
     def begin_list(self, count: int) -> 'AILLEncoder':
         self._code(Structure.BEGIN_LIST)
         self._stream.write_uint16(count)
@@ -454,19 +732,37 @@ class AILLEncoder:
         return self
 
     # ── Convenience: typed lists ──
-    def list_of_float32(self, values: list[float]) -> 'AILLEncoder':
-        """Encode a list of float32 values."""
-        self.begin_list(len(values))
-        for v in values:
-            self.float32(v)
-        self.end_list()
-        return self
-
-    def list_of_int32(self, values: list[int]) -> 'AILLEncoder':
-        self.begin_list(len(values))
-        for v in values:
-            self.int32(v)
-        self.end_list()
+    def _typed_list(self, marker: int, fmt: str, values) -> 'AILLEncoder':
+        """Encode BEGIN_LIST, (marker, value) per element, END_LIST with one pack."""
+        if values.__class__ is not list and values.__class__ is not tuple:
+            values = list(values)  # arrays, generators, ...: one C-level pass
+        n = len(values)
+        args = [marker] * (2 * n + 3)
+        args[0] = Structure.BEGIN_LIST
+        args[1] = n
+        args[3::2] = values
+        args[-1] = Structure.END_LIST
+        self._stream._buf += _list_struct(fmt, n).pack(*args)
+        return self
+
+    def list_of_float16(self, values: Iterable[float]) -> 'AILLEncoder':
+        """Encode a list of float16 values."""
+        return self._typed_list(TypeMarker.TYPE_FLOAT16, 'e', values)
+
+    def list_of_float32(self, values: Iterable[float]) -> 'AILLEncoder':
+        """Encode a list of float32 values from any iterable of numbers."""
+        return self._typed_list(TypeMarker.TYPE_FLOAT32, 'f', values)
+
+    def list_of_int32(self, values: Iterable[int]) -> 'AILLEncoder':
+        return self._typed_list(TypeMarker.TYPE_INT32, 'i', values)
+
+    def domain_field(self, entry: DomainEntry, val) -> 'AILLEncoder':
+        """Encode a field keyed by a domain entry, using its precompiled packer."""
+        if entry.packer is None:
+            raise ValueError(f"{entry.mnemonic} has non-scalar type {entry.value_type}")
+        self.field(entry.code)
+        self._code(entry.type_marker)
+        self._stream.write_raw(entry.packer.pack(val))
         return self
 
     # ── Domain codebook references ──
@@ -7,24 +7,28 @@ Demonstrates two AI agents (a navigation drone and a ground station)
 communicating via the AILL protocol over a simulated acoustic channel.
 """
 
-import sys, os, time, random, struct
+import sys, os, time, random, struct, math
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from aill import (
-    AILLEncoder, AILLDecoder, pretty_print,
+    AILLEncoder, AILLSchema, AILLDecoder, pretty_print,
     AcousticChannel, ChannelConfig, AgentCapabilities, negotiate_session,
     FrameControl, TypeMarker, Structure, Pragmatic, Meta, Modality,
     Temporal, Arithmetic, Escape, Relational,
     NAV1, PERCEPT1, DIAG1, PLAN1, DOMAIN_REGISTRY, crc8,
 )
+from aill.channel import select_modulation
+
+_PRINT_CHARS = "".join(chr(b) if 32 <= b < 127 else "." for b in range(256))
 
 def hex_dump(data, width=16):
     lines = []
-    for i in range(0, len(data), width):
-        chunk = data[i:i+width]
-        h = " ".join(f"{b:02X}" for b in chunk)
-        a = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
-        lines.append(f"  {i:04X}  {h:<{width*3}}  {a}")
+    with memoryview(data) as view:  # chunks are slices of it, not copies
+        for i in range(0, len(view), width):
+            chunk = view[i:i+width]
+            h = chunk.hex(" ").upper()
+            a = "".join(map(_PRINT_CHARS.__getitem__, chunk))
+            lines.append(f"  {i:04X}  {h:<{width*3}}  {a}")
     return "\n".join(lines)
 
 def section(title, c="="):
@@ -38,7 +42,9 @@ def step(num, title):
     print(f"{'─' * 60}")
 
 def transmit(enc, channel, label):
-    wire = enc.end_utterance()
+    # Zero-copy view of the encoder's buffer; hex_dump, the channel and the
+    # decoder all accept bytes-like input
+    wire = enc.end_utterance_view()
     print(f"\n  [{label}]")
     print(f"  Wire format: {len(wire)} bytes")
     print(hex_dump(wire))
@@ -47,8 +53,9 @@ def transmit(enc, channel, label):
           f"BER={stats.ber:.1e}  errors={stats.bits_errored}  "
           f"latency={stats.latency_ms:.1f}ms")
     decoder = AILLDecoder()
-    src = wire if stats.bits_errored > 0 else rx
-    utt = decoder.decode_utterance(src)
+    # rx equals wire when no bits were flipped, and a corrupted rx is not
+    # decoded, so the sender's view serves both cases without a copy
+    utt = decoder.decode_utterance(wire)
     print(f"\n  Decoded:")
     print(pretty_print(utt, indent=2, domain_codebooks=DOMAIN_REGISTRY))
     if stats.bits_errored > 0:
@@ -59,6 +66,10 @@ DRONE  = bytes([0xD0]*8 + [0xD1]*8)
 STATION = bytes([0xA0]*8 + [0xA1]*8)
 TS = 1740000000000000
 
+# NAV-1 position report: POSITION_3D, HEADING, VELOCITY_SCALAR
+POSITION_REPORT = AILLSchema([(0x0000, 'float32', 3),
+                              (0x0002, 'float32'), (0x0006, 'float32')])
+
 def main():
     print("""
     ╔═══════════════════════════════════════════════════════════╗
@@ -96,22 +107,20 @@ def main():
 
     # ═══════════════════════════════════════════════════════════════
     section("PHASE 3: DATA EXCHANGE")
+    drone = AILLEncoder(DRONE)
+    station = AILLEncoder(STATION)
 
     # ── 1: Position report ────────────────────────────────────────
     step(1, "Drone -> Station: Position Report")
-    e = AILLEncoder(DRONE)
+    e = drone.reset()
     e.start_utterance(confidence=0.93, priority=5, timestamp_us=TS, seqnum=1)
     e.assert_().observed()
-    e.begin_struct()
-    e.field(0x0000).list_of_float32([12.5, -3.8, 2.1])
-    e.field(0x0002).float32(1.5708)
-    e.field(0x0006).float32(1.2)
-    e.end_struct()
+    POSITION_REPORT.encode(e, 12.5, -3.8, 2.1, 1.5708, 1.2)
     transmit(e, ch, "Position Report")
 
     # ── 2: Battery query ──────────────────────────────────────────
     step(2, "Station -> Drone: Battery Query")
-    e = AILLEncoder(STATION)
+    e = station.reset()
     e.start_utterance(confidence=1.0, priority=3, timestamp_us=TS+100000,
                       dest_agent=DRONE, seqnum=1)
     e.query()
@@ -120,21 +129,21 @@ def main():
 
     # ── 3: Battery response ───────────────────────────────────────
     step(3, "Drone -> Station: Battery + Health Response")
-    e = AILLEncoder(DRONE)
+    e = drone.reset()
     e.start_utterance(confidence=0.99, priority=3, timestamp_us=TS+200000,
                       dest_agent=STATION, seqnum=2)
     e.assert_()
     e.begin_struct()
-    e.field(0x0000).float16(72.5)   # battery %
-    e.field(0x0001).float16(22.8)   # voltage
-    e.field(0x0005).float32(1800.0) # time remaining (s)
-    e.field(0x0064).uint8(0)        # health: nominal
+    e.field_f16(0x0000, 72.5)    # battery %
+    e.field_f16(0x0001, 22.8)    # voltage
+    e.field_f32(0x0005, 1800.0)  # time remaining (s)
+    e.field_u8(0x0064, 0)        # health: nominal
     e.end_struct()
     transmit(e, ch, "Battery Response")
 
     # ── 4: Obstacle detection ─────────────────────────────────────
     step(4, "Drone -> Station: Obstacle Warning")
-    e = AILLEncoder(DRONE)
+    e = drone.reset()
     e.start_utterance(confidence=0.87, priority=6, timestamp_us=TS+500000, seqnum=3)
     e.warn().observed()
     e.begin_struct()
@@ -142,16 +151,16 @@ def main():
     e.begin_struct()
     e.field(0x0005).list_of_float32([15.2, -2.1, 0.0])  # position
     e.field(0x0062).list_of_float32([1.2, 0.8, 1.5])     # size
-    e.field(0x0061).uint8(1)                               # type: static
+    e.field_u8(0x0061, 1)                                # type: static
     e.end_struct()
-    e.field(0x0065).float16(0.35)   # collision risk
-    e.field(0x0064).float32(2.8)    # clearance
+    e.field_f16(0x0065, 0.35)  # collision risk
+    e.field_f32(0x0064, 2.8)   # clearance
     e.end_struct()
     transmit(e, ch, "Obstacle Warning")
 
     # ── 5: Navigation command ─────────────────────────────────────
     step(5, "Station -> Drone: Navigate to Waypoint")
-    e = AILLEncoder(STATION)
+    e = station.reset()
     e.start_utterance(confidence=1.0, priority=7, timestamp_us=TS+600000,
                       dest_agent=DRONE, seqnum=2)
     e.command()
@@ -165,19 +174,19 @@ def main():
 
     # ── 6: Drone acknowledges ─────────────────────────────────────
     step(6, "Drone -> Station: Command Acknowledgment")
-    e = AILLEncoder(DRONE)
+    e = drone.reset()
     e.start_utterance(confidence=1.0, priority=7, timestamp_us=TS+700000,
                       dest_agent=STATION, seqnum=4)
     e.acknowledge()
     e.begin_struct()
-    e.field(0x0036).float32(18.5)   # ETA: 18.5 seconds
-    e.field(0x0034).uint16(1)       # current waypoint index
+    e.field_f32(0x0036, 18.5)  # ETA: 18.5 seconds
+    e.field_u16(0x0034, 1)     # current waypoint index
     e.end_struct()
     transmit(e, ch, "Command ACK")
 
     # ── 7: Vocabulary extension ───────────────────────────────────
     step(7, "Drone -> Station: Runtime Vocabulary Extension")
-    e = AILLEncoder(DRONE)
+    e = drone.reset()
     e.start_utterance(confidence=1.0, priority=5, timestamp_us=TS+800000, seqnum=5)
     # Define a new concept: "pallet_cluster" via EXTENSION
     e._code(Escape.EXTENSION)
@@ -200,14 +209,14 @@ def main():
 
     # ── 8: Use the new vocabulary ─────────────────────────────────
     step(8, "Drone -> Station: Using Extended Vocabulary")
-    e = AILLEncoder(DRONE)
+    e = drone.reset()
     e.start_utterance(confidence=0.91, priority=5, timestamp_us=TS+900000, seqnum=6)
     e.assert_().observed()
     e.l2_ref(0xF100)  # reference the new pallet_cluster type
     e.begin_struct()
     e.field(0x0000).list_of_float32([20.0, 5.0, 0.0])  # position
-    e.field(0x0001).int16(12)                             # count: 12 pallets
-    e.field(0x0002).float16(0.85)                         # stability
+    e.field_i16(0x0001, 12)                             # count: 12 pallets
+    e.field_f16(0x0002, 0.85)                           # stability
     e.end_struct()
     transmit(e, ch, "Pallet Cluster Report")
 
@@ -216,14 +225,14 @@ def main():
     ch_bad = AcousticChannel(ChannelConfig(snr_db=15.0, distance_m=25.0, reverb_rt60_ms=500.0))
     ch_bad.seed(99)
 
-    e = AILLEncoder(DRONE)
+    e = drone.reset()
     e.start_utterance(confidence=1.0, priority=7, timestamp_us=TS+5000000, seqnum=20)
     e.warn()
     e.modality(Modality.CERTAIN)
     e.begin_struct()
-    e.field(0x0000).float16(5.2)    # battery: 5.2%
-    e.field(0x0005).float32(120.0)  # 2 minutes remaining
-    e.field(0x0064).uint8(2)        # health: CRITICAL
+    e.field_f16(0x0000, 5.2)    # battery: 5.2%
+    e.field_f32(0x0005, 120.0)  # 2 minutes remaining
+    e.field_u8(0x0064, 2)       # health: CRITICAL
     e.end_struct()
     # Also assert: returning home
     e.assert_()
@@ -237,14 +246,15 @@ def main():
     print(f"  {'─'*10}  {'─'*10}  {'─'*12}  {'─'*12}")
     
     test_data = bytes(range(256)) * 4  # 1KB test payload
+    # One channel, re-seeded per level; only the SNR changes between runs
+    test_ch = AcousticChannel(ChannelConfig(distance_m=10.0))
+    attenuation_db = 20 * math.log10(test_ch.config.distance_m)
     for snr in [35, 30, 25, 20, 15, 10, 5]:
-        test_ch = AcousticChannel(ChannelConfig(snr_db=snr, distance_m=10.0))
+        test_ch.config.snr_db = snr
         test_ch.seed(42)
         _, stats = test_ch.transmit(test_data)
         ci = ch.characterize() if snr == 25 else None
-        from aill.channel import select_modulation, MODULATION_SCHEMES
-        eff_snr = snr - 20 * __import__('math').log10(10.0)
-        mod = select_modulation(eff_snr)
+        mod = select_modulation(snr - attenuation_db)
         print(f"  {snr:>8}dB  {mod:>10}  {stats.ber:>12.2e}  {stats.bits_errored:>12}")
 
     # ── Summary ───────────────────────────────────────────────────
@@ -4,36 +4,48 @@ AILL Conformance Test Suite (ACTS) - Core Tests
 Tests the reference implementation against the specification.
 """
 
-import sys, os, struct, math
+import sys, os, struct
+import argparse
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from aill import (
-    AILLEncoder, AILLDecoder, pretty_print,
+    AILLEncoder, AILLSchema, AILLDecoder, pretty_print,
     FrameControl, TypeMarker, Structure, Pragmatic, Meta, Modality,
     Temporal, Arithmetic, Escape, Relational, Logic, Quantifier,
     BASE_CODEBOOK, NAV1, PERCEPT1, MANIP1, COMM1, DIAG1, PLAN1, SAFETY1,
     DOMAIN_REGISTRY, crc8,
 )
-from aill.encoder import encode_float16, decode_float16, encode_varint, decode_varint, ByteStream, EpochBuilder
-from aill.decoder import AILLDecodeError, decode_epoch
+from aill.encoder import (encode_float16, decode_float16, encode_varint, decode_varint,
+                          ByteStream, EpochBuilder,
+                          float32_class, FLOAT32_FINITE, FLOAT32_NAN)
+from aill.decoder import AILLDecodeError, OperationNode, decode_epoch, decode_epochs
+from aill.codebook import DomainCodebook, get_domain_entry
 
 passed = 0
 failed = 0
 errors = 0
 
-def run_test(test_id, description, func):
-    global passed, failed, errors
+def _outcome(func) -> str:
+    """Run one test function and return its status string."""
     try:
-        result = func()
-        if result:
-            passed += 1
-            status = "PASS"
-        else:
-            failed += 1
-            status = "FAIL"
+        return "PASS" if func() else "FAIL"
     except Exception as e:
+        return f"ERROR: {e}"
+
+def run_test(test_id, description, func, status=None):
+    """Report a test, running it first unless its status is already known."""
+    global passed, failed, errors
+    if status is None:
+        status = _outcome(func)
+    if status == "PASS":
+        passed += 1
+    elif status == "FAIL":
+        failed += 1
+    else:
         errors += 1
-        status = f"ERROR: {e}"
     print(f"  {test_id:20s}  [{status:>6s}]  {description}")
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -70,16 +82,15 @@ def tg_ty_003():
         wire = e.end_utterance()
         utt = AILLDecoder().decode_utterance(wire)
         result = utt.body[0].expression.value
-        if math.isinf(v):
-            if not math.isinf(result) or (v > 0) != (result > 0): return False
-        elif result != v:
-            return False
+        cls = float32_class(v)
+        if float32_class(result) != cls: return False
+        if cls == FLOAT32_FINITE and result != v: return False
     # NaN
     e = AILLEncoder()
     e.start_utterance().assert_().float32(float('nan'))
     wire = e.end_utterance()
     utt = AILLDecoder().decode_utterance(wire)
-    return math.isnan(utt.body[0].expression.value)
+    return float32_class(utt.body[0].expression.value) == FLOAT32_NAN
 
 def tg_ty_004():
     """FLOAT16 encode/decode"""
@@ -122,7 +133,14 @@ def tg_ty_008():
     e.start_utterance().assert_().null()
     wire = e.end_utterance()
     utt = AILLDecoder().decode_utterance(wire)
-    return utt.body[0].expression.value is None
+    lit = utt.body[0].expression
+    # The shared null node carries a plain int code and rejects writes
+    try:
+        lit.value = 0
+        return False
+    except AttributeError:
+        pass
+    return lit.value is None and type(lit.code) is int and lit.code == 0x1F
 
 def tg_ty_009():
     """TIMESTAMP encode/decode"""
@@ -141,6 +159,14 @@ def tg_ty_010():
     utt = AILLDecoder().decode_utterance(wire)
     return True  # Basic parse success
 
+def tg_ty_011():
+    """Templated ASSERT INT8 utterance matches the builder chain"""
+    for v in [-128, -1, 0, 1, 127]:
+        built = AILLEncoder().start_utterance(0.5, 6, 1234).assert_().int8(v).end_utterance()
+        if AILLEncoder.emit_assert_int8(v, 0.5, 6, 1234) != built: return False
+    utt = AILLDecoder().decode_utterance(AILLEncoder.emit_assert_int8(-7))
+    return utt.body[0].expression.value == -7
+
 # ═══════════════════════════════════════════════════════════════════════
 # TG-STRUCT: Structure Tests  
 # ═══════════════════════════════════════════════════════════════════════
@@ -166,8 +192,15 @@ def tg_st_002():
     wire = e.end_utterance()
     utt = AILLDecoder().decode_utterance(wire)
     lst = utt.body[0].expression
+    # Any iterable of numbers encodes the same as a list
+    def encode(vals):
+        return (AILLEncoder().start_utterance(timestamp_us=1).assert_()
+                .list_of_float32(vals).end_utterance())
+    ref = encode([1.0, 2.0, 3.0])
+    same = (encode(array('f', [1.0, 2.0, 3.0])) == ref and
+            encode(float(i) for i in (1, 2, 3)) == ref)
     return (lst.node_type == "list" and lst.count == 3 and
-            len(lst.elements) == 3)
+            len(lst.elements) == 3 and same)
 
 def tg_st_003():
     """Nested struct inside list"""
@@ -196,6 +229,148 @@ def tg_st_004():
     m = utt.body[0].expression
     return m.node_type == "map" and m.count == 2 and len(m.pairs) == 2
 
+def tg_st_005():
+    """Struct fields packed from domain entry type signatures"""
+    e = AILLEncoder()
+    e.start_utterance().assert_()
+    e.begin_struct()
+    e.domain_field(DIAG1.lookup(0x0000), 72.5)   # FLOAT16
+    e.domain_field(NAV1.lookup(0x0002), 1.25)    # FLOAT32
+    e.end_struct()
+    wire = e.end_utterance()
+    s = AILLDecoder().decode_utterance(wire).body[0].expression
+    return (s.fields[0x0000].value_type == "float16" and s.fields[0x0000].value == 72.5 and
+            s.fields[0x0002].value_type == "float32" and s.fields[0x0002].value == 1.25)
+
+def tg_st_006():
+    """Packed lists decode homogeneous numerics to one array node"""
+    vals = [0.5, -1.25, 3.0, 100.0]
+    e = AILLEncoder()
+    e.start_utterance().assert_().list_of_float32(vals)
+    wire = e.end_utterance()
+    packed = AILLDecoder(packed_lists=True).decode_utterance(wire).body[0].expression
+    plain = AILLDecoder().decode_utterance(wire).body[0].expression
+    return (packed.node_type == "array" and packed.value_type == "float32" and
+            packed.values.tolist() == vals and
+            [el.value for el in plain.elements] == vals)
+
+def tg_st_007():
+    """Released literal nodes are reused by later decodes"""
+    e = AILLEncoder()
+    e.start_utterance().assert_().begin_list(2).int8(1).uint16(7).end_list()
+    wire = e.end_utterance()
+    d = AILLDecoder()
+    first = d.decode_utterance(wire)
+    first_ids = {id(el) for el in first.body[0].expression.elements}
+    d.release(first)
+    second = d.decode_utterance(wire).body[0].expression.elements
+    # Operands of operation nodes are returned to the freelist too
+    operand = second[0]
+    d.release(OperationNode(node_type="operation", operands=[operand]))
+    # Each decoder keeps its own freelist
+    other = AILLDecoder().decode_utterance(wire).body[0].expression.elements
+    third = d.decode_utterance(wire).body[0].expression.elements
+    return ({id(el) for el in second} == first_ids and
+            [(el.value_type, el.value) for el in second] == [("int8", 1), ("uint16", 7)] and
+            all(el is not operand for el in other) and any(el is operand for el in third))
+
+def tg_st_008():
+    """ByteStream exposes its contents without copying"""
+    bs = ByteStream().write_uint16(0xA111).write_float32(1.5)
+    view = bs.to_memoryview()
+    ok = view.tobytes() == bs.to_bytes() == b'\xa1\x11' + struct.pack('>f', 1.5)
+    view.release()
+    bs.write_uint8(7)
+    return ok and bs.to_bytes()[-1] == 7
+
+def tg_st_009():
+    """List of float16 packs one marker per element"""
+    vals = [0.5, -2.0, 65504.0]
+    e = AILLEncoder()
+    e.start_utterance().assert_().list_of_float16(vals)
+    wire = e.end_utterance()
+    lst = AILLDecoder().decode_utterance(wire).body[0].expression
+    return (lst.count == 3 and
+            [(el.value_type, el.value) for el in lst.elements] == [("float16", v) for v in vals])
+
+def tg_st_010():
+    """Fused field builders match the chained form byte for byte"""
+    fused = AILLEncoder()
+    fused.start_utterance(timestamp_us=1).begin_struct()
+    fused.field_f16(1, 0.5).field_f32(2, 1.5).field_i16(3, -7).field_u8(4, 9).field_u16(5, 300)
+    chained = AILLEncoder()
+    chained.start_utterance(timestamp_us=1).begin_struct()
+    chained.field(1).float16(0.5).field(2).float32(1.5).field(3).int16(-7)
+    chained.field(4).uint8(9).field(5).uint16(300)
+    return fused.end_struct().end_utterance() == chained.end_struct().end_utterance()
+
+def tg_st_011():
+    """Encoder reuse via reset() and zero-copy end_utterance_view()"""
+    e = AILLEncoder()
+    first = e.start_utterance(timestamp_us=1).assert_().int8(1).end_utterance()
+    view = e.reset().start_utterance(timestamp_us=1).assert_().int8(1).end_utterance_view()
+    same = view == first
+    e.reset()   # view still alive: encoder moves to a fresh buffer
+    second = e.start_utterance(timestamp_us=1).assert_().int8(2).end_utterance()
+    return same and view == first and AILLDecoder().decode_utterance(second).body[0].expression.value == 2
+
+def tg_st_012():
+    """Compiled AILLSchema matches the equivalent builder chain"""
+    schema = AILLSchema([(0x0000, 'float32', 3), (0x0002, 'float16'), (0x0064, 'uint8')])
+    e = AILLEncoder()
+    chained = (e.start_utterance(timestamp_us=1).assert_().begin_struct()
+               .field(0x0000).list_of_float32([1.0, 2.0, 3.0])
+               .field_f16(0x0002, 0.5).field_u8(0x0064, 7)
+               .end_struct().end_utterance())
+    e.reset().start_utterance(timestamp_us=1).assert_()
+    compiled = schema.encode(e, 1.0, 2.0, 3.0, 0.5, 7).end_utterance()
+    # Field codes reach the generated source only as coerced integers
+    class Code(int):
+        def __str__(self): return "__import__('os')"
+    coerced = AILLSchema([(Code(0x0ABC), 'float16')])
+    via_schema = coerced.encode(e.reset().start_utterance(timestamp_us=1).assert_(), 0.5).end_utterance()
+    e.reset().start_utterance(timestamp_us=1).assert_()
+    via_chain = e.begin_struct().field_f16(0x0ABC, 0.5).end_struct().end_utterance()
+    try:
+        AILLSchema([("2", 'float16')])
+        return False
+    except TypeError:
+        pass
+    return (compiled == chained and via_schema == via_chain and
+            AILLSchema(schema.fields).encode is schema.encode)
+
+def tg_st_013():
+    """Long homogeneous lists bulk-decode to the per-element node shape"""
+    vals = [float(i) / 4 for i in range(16)]
+    e = AILLEncoder()
+    e.start_utterance().assert_().list_of_float16(vals)
+    e.begin_list(9)
+    for v in vals[:8]:
+        e.float16(v)
+    e.int8(-1).end_list()   # mixed run: element-wise fallback
+    utt = AILLDecoder().decode_utterance(e.end_utterance())
+    bulk, mixed = utt.body[0].expression, utt.body[1]
+    return ([(el.node_type, el.value_type, el.value) for el in bulk.elements] ==
+            [("literal", "float16", v) for v in vals] and
+            [el.value for el in mixed.elements] == vals[:8] + [-1])
+
+def tg_st_014():
+    """A bytearray can be resized once decoding from it has finished"""
+    e = AILLEncoder()
+    e.start_utterance().assert_().int32(5)
+    buf = bytearray(e.end_utterance())
+    d = AILLDecoder()
+    ok = d.decode_utterance(buf).body[0].expression.value == 5
+    buf.clear()                    # raises BufferError if still exported
+    buf += b'\xff'
+    try:
+        d.decode_utterance(buf)
+        return False
+    except AILLDecodeError:
+        pass
+    buf.clear()                    # ... including after a failed decode
+    return ok
+
 # ═══════════════════════════════════════════════════════════════════════
 # TG-EXPR: Expression Tests
 # ═══════════════════════════════════════════════════════════════════════
@@ -300,7 +475,8 @@ def tg_crc_003():
     epochs = eb.get_epochs()
     assert len(epochs) == 1
     decoded, consumed = decode_epoch(epochs[0])
-    return decoded.crc_ok and decoded.payload == b'Hello AILL'
+    return (decoded.crc_ok and decoded.payload == b'Hello AILL' and
+            eb.get_epochs_view() == epochs and eb.get_stream_bytes() == epochs[0])
 
 def tg_crc_004():
     """Epoch CRC failure detection"""
@@ -313,6 +489,33 @@ def tg_crc_004():
     decoded, _ = decode_epoch(bytes(corrupted))
     return not decoded.crc_ok
 
+def tg_crc_005():
+    """Bulk decode of a multi-epoch stream"""
+    eb = EpochBuilder()
+    eb.write(b'A' * 5000)
+    eb.write(b'B' * 5000)
+    eb.write(b'C' * 10)
+    stream = bytearray(eb.get_stream_bytes())
+    stream[-3] ^= 0x01   # corrupt the last epoch's payload
+    decoded = decode_epochs(bytes(stream))
+    return ([d.seq_num for d in decoded] == [0, 1] and
+            [d.crc_ok for d in decoded] == [True, False] and
+            decoded[0].payload == b'A' * 5000)
+
+def tg_crc_006():
+    """Parallel CRC verification matches serial"""
+    eb = EpochBuilder()
+    for _ in range(8):
+        eb.write(bytes(range(256)) * 8)
+        eb.flush()
+    stream = bytearray(eb.get_stream_bytes())
+    stream[100] ^= 0x01   # corrupt the first epoch's payload
+    serial = decode_epochs(bytes(stream))
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        parallel = decode_epochs(bytes(stream), executor=pool)
+    return (len(serial) > 2 and serial == parallel and
+            [d.crc_ok for d in parallel] == [False] + [True] * (len(parallel) - 1))
+
 # ═══════════════════════════════════════════════════════════════════════
 # TG-VARINT: Variable-Length Integer Tests
 # ═══════════════════════════════════════════════════════════════════════
@@ -362,6 +565,43 @@ def tg_cd_003():
     return (DIAG1.lookup(0x0000) is not None and
             DIAG1.lookup(0x0000).mnemonic == "BATTERY_LEVEL")
 
+def tg_cd_004():
+    """Batch code validation against a domain codebook"""
+    return NAV1.validate_batch([0x0000, 0x0090, 0xFFFF]) == [True, True, False]
+
+def tg_cd_005():
+    """Cross-domain lookup by (registry, code)"""
+    # An unregistered codebook sharing a standard ID does not shadow it
+    DomainCodebook(0x01, "NAV-1", "Local copy").add(0x0000, "MY_POS", "FLOAT32")
+    return (get_domain_entry(0x05, 0x0000) is DIAG1.lookup(0x0000) and
+            get_domain_entry(0x01, 0x0000).mnemonic == "POSITION_3D" and
+            get_domain_entry(0x7F, 0x0000) is None)
+
+def tg_cd_006():
+    """Registry accepts, replaces and removes codebooks like a dict"""
+    cb = DomainCodebook(0x7E, "TEST-1", "Test domain")
+    cb.add(0x0000, "PROBE", "UINT8")
+    DOMAIN_REGISTRY[0x7E] = cb
+    try:
+        ok = (DOMAIN_REGISTRY[0x7E] is cb and 0x7E in DOMAIN_REGISTRY and
+              len(DOMAIN_REGISTRY) == 8 and get_domain_entry(0x7E, 0x0000).mnemonic == "PROBE")
+    finally:
+        del DOMAIN_REGISTRY[0x7E]
+    return (ok and 0x7E not in DOMAIN_REGISTRY and len(DOMAIN_REGISTRY) == 7 and
+            get_domain_entry(0x7E, 0x0000) is None)
+
+def tg_cd_007():
+    """Pretty-printed field labels follow in-place codebook edits"""
+    cb = DomainCodebook(0x7E, "TEST-1", "Test domain")
+    cb.add(0x0002, "HEADING", "FLOAT32")
+    e = AILLEncoder()
+    e.start_utterance().assert_().begin_struct().field(0x0002).float32(1.0).end_struct()
+    utt = AILLDecoder().decode_utterance(e.end_utterance())
+    before = pretty_print(utt, domain_codebooks={0x7E: cb})
+    cb.add(0x0002, "HEADING_RENAMED", "FLOAT32")
+    after = pretty_print(utt, domain_codebooks={0x7E: cb})
+    return "HEADING:" in before and "HEADING_RENAMED:" in after
+
 # ═══════════════════════════════════════════════════════════════════════
 # TG-ERR: Error Handling Tests
 # ═══════════════════════════════════════════════════════════════════════
@@ -390,11 +630,199 @@ def tg_er_003():
     except AILLDecodeError:
         return True
 
+def tg_er_004():
+    """UUID of the wrong length is rejected"""
+    try:
+        ByteStream().write_uuid(b'\x00' * 15)
+        return False
+    except ValueError:
+        return True
+
+# ═══════════════════════════════════════════════════════════════════════
+# TG-DOMAIN: Full Domain Codebook Validation
+# ═══════════════════════════════════════════════════════════════════════
+
+def tg_dom_001():
+    """MANIP-1 codebook loaded"""
+    return MANIP1.lookup(0x0000) is not None and MANIP1.lookup(0x0000).mnemonic == "GRIPPER_STATE"
+
+def tg_dom_002():
+    """COMM-1 codebook loaded"""
+    return COMM1.lookup(0x0000) is not None and COMM1.lookup(0x0000).mnemonic == "AGENT_UUID"
+
+def tg_dom_003():
+    """SAFETY-1 codebook loaded"""
+    return SAFETY1.lookup(0x0000) is not None and SAFETY1.lookup(0x0000).mnemonic == "EMERGENCY_LEVEL"
+
+def tg_dom_004():
+    """PLAN-1 expanded (negotiation)"""
+    return PLAN1.lookup(0x0020) is not None and PLAN1.lookup(0x0020).mnemonic == "OFFER"
+
+def tg_dom_005():
+    """NAV-1 expanded (mapping)"""
+    return NAV1.lookup(0x00C0) is not None and NAV1.lookup(0x00C0).mnemonic == "MAP_ORIGIN"
+
+def tg_dom_006():
+    """NAV-1 expanded (multi-agent)"""
+    return NAV1.lookup(0x0110) is not None and NAV1.lookup(0x0110).mnemonic == "SWARM_CENTER"
+
+def tg_dom_007():
+    """PERCEPT-1 expanded (scene)"""
+    return PERCEPT1.lookup(0x0090) is not None and PERCEPT1.lookup(0x0090).mnemonic == "SCENE_GRAPH"
+
+def tg_dom_008():
+    """PERCEPT-1 expanded (audio)"""
+    return PERCEPT1.lookup(0x00D0) is not None and PERCEPT1.lookup(0x00D0).mnemonic == "SOUND_EVENT"
+
+def tg_dom_009():
+    """PERCEPT-1 expanded (tactile)"""
+    return PERCEPT1.lookup(0x00E0) is not None and PERCEPT1.lookup(0x00E0).mnemonic == "CONTACT_DETECTED"
+
+def tg_dom_010():
+    """DIAG-1 expanded (thermal)"""
+    return DIAG1.lookup(0x0080) is not None and DIAG1.lookup(0x0080).mnemonic == "THERMAL_MAP"
+
+def tg_dom_011():
+    """DIAG-1 expanded (software)"""
+    return DIAG1.lookup(0x00B0) is not None and DIAG1.lookup(0x00B0).mnemonic == "PROCESS_LIST"
+
+def tg_dom_012():
+    """MANIP-1 grasp planning"""
+    return MANIP1.lookup(0x0060) is not None and MANIP1.lookup(0x0060).mnemonic == "GRASP_POSE"
+
+def tg_dom_013():
+    """MANIP-1 manipulation actions"""
+    return MANIP1.lookup(0x0080) is not None and MANIP1.lookup(0x0080).mnemonic == "PICK"
+
+def tg_dom_014():
+    """COMM-1 routing"""
+    return COMM1.lookup(0x0020) is not None and COMM1.lookup(0x0020).mnemonic == "UNICAST"
+
+def tg_dom_015():
+    """COMM-1 data sync"""
+    return COMM1.lookup(0x0080) is not None and COMM1.lookup(0x0080).mnemonic == "SYNC_REQUEST"
+
+def tg_dom_016():
+    """SAFETY-1 human safety"""
+    return SAFETY1.lookup(0x0020) is not None and SAFETY1.lookup(0x0020).mnemonic == "HUMAN_DETECTED"
+
+def tg_dom_017():
+    """SAFETY-1 fault handling"""
+    return SAFETY1.lookup(0x0040) is not None and SAFETY1.lookup(0x0040).mnemonic == "FAULT_DETECTED"
+
+def tg_dom_018():
+    """SAFETY-1 geofence/regulatory"""
+    return SAFETY1.lookup(0x0060) is not None and SAFETY1.lookup(0x0060).mnemonic == "GEOFENCE_BREACH"
+
+def tg_dom_019():
+    """7 codebooks in registry"""
+    return len(DOMAIN_REGISTRY) == 7
+
+def tg_dom_020():
+    """Total domain entries >= 550"""
+    return sum(len(cb) for cb in DOMAIN_REGISTRY.values()) >= 550
+
 # ═══════════════════════════════════════════════════════════════════════
 # RUN ALL TESTS
 # ═══════════════════════════════════════════════════════════════════════
 
-def main():
+# (section title, [(test id, description, test function)]) in run order
+_SECTIONS = [
+    ("TG-TYPES: Type System", [
+        ("TG-TY-001", "INT8 round-trip (boundary values)", tg_ty_001),
+        ("TG-TY-002", "INT32 round-trip (boundary values)", tg_ty_002),
+        ("TG-TY-003", "FLOAT32 including special values", tg_ty_003),
+        ("TG-TY-004", "FLOAT16 encode/decode", tg_ty_004),
+        ("TG-TY-005", "STRING with UTF-8 (incl emoji)", tg_ty_005),
+        ("TG-TY-006", "Empty string", tg_ty_006),
+        ("TG-TY-007", "BOOL true/false", tg_ty_007),
+        ("TG-TY-008", "NULL type", tg_ty_008),
+        ("TG-TY-009", "TIMESTAMP int64", tg_ty_009),
+        ("TG-TY-010", "UINT16 and UINT32", tg_ty_010),
+        ("TG-TY-011", "Templated ASSERT INT8", tg_ty_011),
+    ]),
+    ("TG-STRUCT: Structure Types", [
+        ("TG-ST-001", "Simple struct with fields", tg_st_001),
+        ("TG-ST-002", "List of float32", tg_st_002),
+        ("TG-ST-003", "Nested struct inside list", tg_st_003),
+        ("TG-ST-004", "Map with key-value pairs", tg_st_004),
+        ("TG-ST-005", "Domain-typed struct fields", tg_st_005),
+        ("TG-ST-006", "Packed numeric list decode", tg_st_006),
+        ("TG-ST-007", "Literal node freelist", tg_st_007),
+        ("TG-ST-008", "ByteStream memoryview export", tg_st_008),
+        ("TG-ST-009", "List of float16", tg_st_009),
+        ("TG-ST-010", "Fused field builders", tg_st_010),
+        ("TG-ST-011", "Encoder reset and view", tg_st_011),
+        ("TG-ST-012", "Compiled struct schema", tg_st_012),
+        ("TG-ST-013", "Bulk list decode", tg_st_013),
+        ("TG-ST-014", "Input buffer released", tg_st_014),
+    ]),
+    ("TG-EXPR: Expression Parsing", [
+        ("TG-EX-001", "ASSERT wraps expression", tg_ex_001),
+        ("TG-EX-002", "QUERY pragmatic act", tg_ex_002),
+        ("TG-EX-003", "OBSERVED modality", tg_ex_003),
+        ("TG-EX-004", "PREDICTED with horizon", tg_ex_004),
+        ("TG-EX-005", "PAST temporal modifier", tg_ex_005),
+        ("TG-EX-006", "L1 domain reference", tg_ex_006),
+    ]),
+    ("TG-META: Meta Header", [
+        ("TG-MT-001", "Confidence/priority/timestamp", tg_mt_001),
+        ("TG-MT-002", "Dest agent and seqnum", tg_mt_002),
+    ]),
+    ("TG-CRC: CRC and Epoch Integrity", [
+        ("TG-CRC-001", "CRC-8 empty vector", tg_crc_001),
+        ("TG-CRC-002", "CRC-8 standard test vector", tg_crc_002),
+        ("TG-CRC-003", "Epoch encode/decode with CRC", tg_crc_003),
+        ("TG-CRC-004", "Epoch CRC failure detection", tg_crc_004),
+        ("TG-CRC-005", "Bulk multi-epoch decode", tg_crc_005),
+        ("TG-CRC-006", "Parallel CRC verification", tg_crc_006),
+    ]),
+    ("TG-VARINT: Variable-Length Integers", [
+        ("TG-VI-001", "1-byte values (0-127)", tg_vi_001),
+        ("TG-VI-002", "2-byte values (128-16383)", tg_vi_002),
+        ("TG-VI-003", "Large values (16K+)", tg_vi_003),
+    ]),
+    ("TG-CODEC: Codebook", [
+        ("TG-CD-001", "All 256 base codebook entries", tg_cd_001),
+        ("TG-CD-002", "NAV-1 domain codebook", tg_cd_002),
+        ("TG-CD-003", "DIAG-1 domain codebook", tg_cd_003),
+        ("TG-CD-004", "Batch code validation", tg_cd_004),
+        ("TG-CD-005", "Cross-domain entry lookup", tg_cd_005),
+        ("TG-CD-006", "Mutable domain registry", tg_cd_006),
+        ("TG-CD-007", "Pretty-print field labels", tg_cd_007),
+    ]),
+    ("TG-DOMAIN: Full Domain Codebook Validation", [
+        ("TG-DOM-001", "MANIP-1 codebook loaded", tg_dom_001),
+        ("TG-DOM-002", "COMM-1 codebook loaded", tg_dom_002),
+        ("TG-DOM-003", "SAFETY-1 codebook loaded", tg_dom_003),
+        ("TG-DOM-004", "PLAN-1 expanded (negotiation)", tg_dom_004),
+        ("TG-DOM-005", "NAV-1 expanded (mapping)", tg_dom_005),
+        ("TG-DOM-006", "NAV-1 expanded (multi-agent)", tg_dom_006),
+        ("TG-DOM-007", "PERCEPT-1 expanded (scene)", tg_dom_007),
+        ("TG-DOM-008", "PERCEPT-1 expanded (audio)", tg_dom_008),
+        ("TG-DOM-009", "PERCEPT-1 expanded (tactile)", tg_dom_009),
+        ("TG-DOM-010", "DIAG-1 expanded (thermal)", tg_dom_010),
+        ("TG-DOM-011", "DIAG-1 expanded (software)", tg_dom_011),
+        ("TG-DOM-012", "MANIP-1 grasp planning", tg_dom_012),
+        ("TG-DOM-013", "MANIP-1 manipulation actions", tg_dom_013),
+        ("TG-DOM-014", "COMM-1 routing", tg_dom_014),
+        ("TG-DOM-015", "COMM-1 data sync", tg_dom_015),
+        ("TG-DOM-016", "SAFETY-1 human safety", tg_dom_016),
+        ("TG-DOM-017", "SAFETY-1 fault handling", tg_dom_017),
+        ("TG-DOM-018", "SAFETY-1 geofence/regulatory", tg_dom_018),
+        ("TG-DOM-019", "7 codebooks in registry", tg_dom_019),
+        ("TG-DOM-020", "Total domain entries >= 550", tg_dom_020),
+    ]),
+    ("TG-ERR: Error Handling", [
+        ("TG-ER-001", "Missing START_UTTERANCE", tg_er_001),
+        ("TG-ER-002", "Truncated data", tg_er_002),
+        ("TG-ER-003", "Insufficient epoch data", tg_er_003),
+        ("TG-ER-004", "Bad UUID length", tg_er_004),
+    ]),
+]
+
+def main(workers: Optional[int] = None):
+    """Run the suite, farming tests out to `workers` processes if > 1."""
     print("""
     ╔═══════════════════════════════════════════════════════════╗
     ║   AILL Conformance Test Suite (ACTS)                     ║
@@ -402,87 +830,23 @@ def main():
     ╚═══════════════════════════════════════════════════════════╝
     """)
 
-    print("  TG-TYPES: Type System")
-    print("  " + "─" * 56)
-    run_test("TG-TY-001", "INT8 round-trip (boundary values)", tg_ty_001)
-    run_test("TG-TY-002", "INT32 round-trip (boundary values)", tg_ty_002)
-    run_test("TG-TY-003", "FLOAT32 including special values", tg_ty_003)
-    run_test("TG-TY-004", "FLOAT16 encode/decode", tg_ty_004)
-    run_test("TG-TY-005", "STRING with UTF-8 (incl emoji)", tg_ty_005)
-    run_test("TG-TY-006", "Empty string", tg_ty_006)
-    run_test("TG-TY-007", "BOOL true/false", tg_ty_007)
-    run_test("TG-TY-008", "NULL type", tg_ty_008)
-    run_test("TG-TY-009", "TIMESTAMP int64", tg_ty_009)
-    run_test("TG-TY-010", "UINT16 and UINT32", tg_ty_010)
-
-    print("\n  TG-STRUCT: Structure Types")
-    print("  " + "─" * 56)
-    run_test("TG-ST-001", "Simple struct with fields", tg_st_001)
-    run_test("TG-ST-002", "List of float32", tg_st_002)
-    run_test("TG-ST-003", "Nested struct inside list", tg_st_003)
-    run_test("TG-ST-004", "Map with key-value pairs", tg_st_004)
-
-    print("\n  TG-EXPR: Expression Parsing")
-    print("  " + "─" * 56)
-    run_test("TG-EX-001", "ASSERT wraps expression", tg_ex_001)
-    run_test("TG-EX-002", "QUERY pragmatic act", tg_ex_002)
-    run_test("TG-EX-003", "OBSERVED modality", tg_ex_003)
-    run_test("TG-EX-004", "PREDICTED with horizon", tg_ex_004)
-    run_test("TG-EX-005", "PAST temporal modifier", tg_ex_005)
-    run_test("TG-EX-006", "L1 domain reference", tg_ex_006)
-
-    print("\n  TG-META: Meta Header")
-    print("  " + "─" * 56)
-    run_test("TG-MT-001", "Confidence/priority/timestamp", tg_mt_001)
-    run_test("TG-MT-002", "Dest agent and seqnum", tg_mt_002)
-
-    print("\n  TG-CRC: CRC and Epoch Integrity")
-    print("  " + "─" * 56)
-    run_test("TG-CRC-001", "CRC-8 empty vector", tg_crc_001)
-    run_test("TG-CRC-002", "CRC-8 standard test vector", tg_crc_002)
-    run_test("TG-CRC-003", "Epoch encode/decode with CRC", tg_crc_003)
-    run_test("TG-CRC-004", "Epoch CRC failure detection", tg_crc_004)
-
-    print("\n  TG-VARINT: Variable-Length Integers")
-    print("  " + "─" * 56)
-    run_test("TG-VI-001", "1-byte values (0-127)", tg_vi_001)
-    run_test("TG-VI-002", "2-byte values (128-16383)", tg_vi_002)
-    run_test("TG-VI-003", "Large values (16K+)", tg_vi_003)
-
-    print("\n  TG-CODEC: Codebook")
-    print("  " + "─" * 56)
-    run_test("TG-CD-001", "All 256 base codebook entries", tg_cd_001)
-    run_test("TG-CD-002", "NAV-1 domain codebook", tg_cd_002)
-    run_test("TG-CD-003", "DIAG-1 domain codebook", tg_cd_003)
-
-    print("\n  TG-DOMAIN: Full Domain Codebook Validation")
-    print("  " + "─" * 56)
-    run_test("TG-DOM-001", "MANIP-1 codebook loaded",      lambda: MANIP1.lookup(0x0000) is not None and MANIP1.lookup(0x0000).mnemonic == "GRIPPER_STATE")
-    run_test("TG-DOM-002", "COMM-1 codebook loaded",       lambda: COMM1.lookup(0x0000) is not None and COMM1.lookup(0x0000).mnemonic == "AGENT_UUID")
-    run_test("TG-DOM-003", "SAFETY-1 codebook loaded",     lambda: SAFETY1.lookup(0x0000) is not None and SAFETY1.lookup(0x0000).mnemonic == "EMERGENCY_LEVEL")
-    run_test("TG-DOM-004", "PLAN-1 expanded (negotiation)", lambda: PLAN1.lookup(0x0020) is not None and PLAN1.lookup(0x0020).mnemonic == "OFFER")
-    run_test("TG-DOM-005", "NAV-1 expanded (mapping)",     lambda: NAV1.lookup(0x00C0) is not None and NAV1.lookup(0x00C0).mnemonic == "MAP_ORIGIN")
-    run_test("TG-DOM-006", "NAV-1 expanded (multi-agent)", lambda: NAV1.lookup(0x0110) is not None and NAV1.lookup(0x0110).mnemonic == "SWARM_CENTER")
-    run_test("TG-DOM-007", "PERCEPT-1 expanded (scene)",   lambda: PERCEPT1.lookup(0x0090) is not None and PERCEPT1.lookup(0x0090).mnemonic == "SCENE_GRAPH")
-    run_test("TG-DOM-008", "PERCEPT-1 expanded (audio)",   lambda: PERCEPT1.lookup(0x00D0) is not None and PERCEPT1.lookup(0x00D0).mnemonic == "SOUND_EVENT")
-    run_test("TG-DOM-009", "PERCEPT-1 expanded (tactile)", lambda: PERCEPT1.lookup(0x00E0) is not None and PERCEPT1.lookup(0x00E0).mnemonic == "CONTACT_DETECTED")
-    run_test("TG-DOM-010", "DIAG-1 expanded (thermal)",    lambda: DIAG1.lookup(0x0080) is not None and DIAG1.lookup(0x0080).mnemonic == "THERMAL_MAP")
-    run_test("TG-DOM-011", "DIAG-1 expanded (software)",   lambda: DIAG1.lookup(0x00B0) is not None and DIAG1.lookup(0x00B0).mnemonic == "PROCESS_LIST")
-    run_test("TG-DOM-012", "MANIP-1 grasp planning",       lambda: MANIP1.lookup(0x0060) is not None and MANIP1.lookup(0x0060).mnemonic == "GRASP_POSE")
-    run_test("TG-DOM-013", "MANIP-1 manipulation actions",  lambda: MANIP1.lookup(0x0080) is not None and MANIP1.lookup(0x0080).mnemonic == "PICK")
-    run_test("TG-DOM-014", "COMM-1 routing",               lambda: COMM1.lookup(0x0020) is not None and COMM1.lookup(0x0020).mnemonic == "UNICAST")
-    run_test("TG-DOM-015", "COMM-1 data sync",             lambda: COMM1.lookup(0x0080) is not None and COMM1.lookup(0x0080).mnemonic == "SYNC_REQUEST")
-    run_test("TG-DOM-016", "SAFETY-1 human safety",        lambda: SAFETY1.lookup(0x0020) is not None and SAFETY1.lookup(0x0020).mnemonic == "HUMAN_DETECTED")
-    run_test("TG-DOM-017", "SAFETY-1 fault handling",      lambda: SAFETY1.lookup(0x0040) is not None and SAFETY1.lookup(0x0040).mnemonic == "FAULT_DETECTED")
-    run_test("TG-DOM-018", "SAFETY-1 geofence/regulatory", lambda: SAFETY1.lookup(0x0060) is not None and SAFETY1.lookup(0x0060).mnemonic == "GEOFENCE_BREACH")
-    run_test("TG-DOM-019", "7 codebooks in registry",      lambda: len(DOMAIN_REGISTRY) == 7)
-    run_test("TG-DOM-020", "Total domain entries >= 550",   lambda: sum(len(cb) for cb in DOMAIN_REGISTRY.values()) >= 550)
-
-    print("\n  TG-ERR: Error Handling")
-    print("  " + "─" * 56)
-    run_test("TG-ER-001", "Missing START_UTTERANCE", tg_er_001)
-    run_test("TG-ER-002", "Truncated data", tg_er_002)
-    run_test("TG-ER-003", "Insufficient epoch data", tg_er_003)
+    tests = [func for _, group in _SECTIONS for _, _, func in group]
+    if workers is not None and workers > 1:
+        # Each test builds its own encoders and decoders, and the one test
+        # that edits DOMAIN_REGISTRY restores it, so tests can run in any
+        # worker; results still come back (and are reported) in suite order
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            statuses = pool.map(_outcome, tests)
+    else:
+        statuses = map(_outcome, tests)
+
+    for i, (title, group) in enumerate(_SECTIONS):
+        if i:
+            print()
+        print(f"  {title}")
+        print("  " + "─" * 56)
+        for test_id, description, func in group:
+            run_test(test_id, description, func, next(statuses))
 
     # Summary
     total = passed + failed + errors
@@ -498,7 +862,10 @@ def main():
     return 0 if (failed == 0 and errors == 0) else 1
 
 if __name__ == "__main__":
-    sys.exit(main())
+    parser = argparse.ArgumentParser(description="AILL conformance test suite")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="run the tests in this many worker processes")
+    sys.exit(main(parser.parse_args().jobs))
 
 # ═══════════════════════════════════════════════════════════════════════
 # Pytest-compatible wrappers
@@ -506,64 +873,10 @@ if __name__ == "__main__":
 
 import pytest
 
-_ALL_TESTS = [
-    ("TG-TY-001", "INT8 round-trip", tg_ty_001),
-    ("TG-TY-002", "INT32 round-trip", tg_ty_002),
-    ("TG-TY-003", "FLOAT32 special values", tg_ty_003),
-    ("TG-TY-004", "FLOAT16 encode/decode", tg_ty_004),
-    ("TG-TY-005", "STRING UTF-8", tg_ty_005),
-    ("TG-TY-006", "Empty string", tg_ty_006),
-    ("TG-TY-007", "BOOL", tg_ty_007),
-    ("TG-TY-008", "NULL", tg_ty_008),
-    ("TG-TY-009", "TIMESTAMP", tg_ty_009),
-    ("TG-TY-010", "UINT16/UINT32", tg_ty_010),
-    ("TG-ST-001", "Simple struct", tg_st_001),
-    ("TG-ST-002", "List of float32", tg_st_002),
-    ("TG-ST-003", "Nested struct in list", tg_st_003),
-    ("TG-ST-004", "Map", tg_st_004),
-    ("TG-EX-001", "ASSERT wraps expression", tg_ex_001),
-    ("TG-EX-002", "QUERY", tg_ex_002),
-    ("TG-EX-003", "OBSERVED modality", tg_ex_003),
-    ("TG-EX-004", "PREDICTED with horizon", tg_ex_004),
-    ("TG-EX-005", "PAST temporal", tg_ex_005),
-    ("TG-EX-006", "L1 domain reference", tg_ex_006),
-    ("TG-MT-001", "Confidence/priority/timestamp", tg_mt_001),
-    ("TG-MT-002", "Dest agent and seqnum", tg_mt_002),
-    ("TG-CRC-001", "CRC-8 empty vector", tg_crc_001),
-    ("TG-CRC-002", "CRC-8 standard vector", tg_crc_002),
-    ("TG-CRC-003", "Epoch roundtrip", tg_crc_003),
-    ("TG-CRC-004", "Epoch CRC failure", tg_crc_004),
-    ("TG-VI-001", "VarInt 1-byte", tg_vi_001),
-    ("TG-VI-002", "VarInt 2-byte", tg_vi_002),
-    ("TG-VI-003", "VarInt large", tg_vi_003),
-    ("TG-CD-001", "All 256 base entries", tg_cd_001),
-    ("TG-CD-002", "NAV-1 codebook", tg_cd_002),
-    ("TG-CD-003", "DIAG-1 codebook", tg_cd_003),
-    ("TG-DOM-001", "MANIP-1 codebook loaded", lambda: MANIP1.lookup(0x0000) is not None and MANIP1.lookup(0x0000).mnemonic == "GRIPPER_STATE"),
-    ("TG-DOM-002", "COMM-1 codebook loaded", lambda: COMM1.lookup(0x0000) is not None and COMM1.lookup(0x0000).mnemonic == "AGENT_UUID"),
-    ("TG-DOM-003", "SAFETY-1 codebook loaded", lambda: SAFETY1.lookup(0x0000) is not None and SAFETY1.lookup(0x0000).mnemonic == "EMERGENCY_LEVEL"),
-    ("TG-DOM-004", "PLAN-1 expanded (negotiation)", lambda: PLAN1.lookup(0x0020) is not None and PLAN1.lookup(0x0020).mnemonic == "OFFER"),
-    ("TG-DOM-005", "NAV-1 expanded (mapping)", lambda: NAV1.lookup(0x00C0) is not None and NAV1.lookup(0x00C0).mnemonic == "MAP_ORIGIN"),
-    ("TG-DOM-006", "NAV-1 expanded (multi-agent)", lambda: NAV1.lookup(0x0110) is not None and NAV1.lookup(0x0110).mnemonic == "SWARM_CENTER"),
-    ("TG-DOM-007", "PERCEPT-1 expanded (scene)", lambda: PERCEPT1.lookup(0x0090) is not None and PERCEPT1.lookup(0x0090).mnemonic == "SCENE_GRAPH"),
-    ("TG-DOM-008", "PERCEPT-1 expanded (audio)", lambda: PERCEPT1.lookup(0x00D0) is not None and PERCEPT1.lookup(0x00D0).mnemonic == "SOUND_EVENT"),
-    ("TG-DOM-009", "PERCEPT-1 expanded (tactile)", lambda: PERCEPT1.lookup(0x00E0) is not None and PERCEPT1.lookup(0x00E0).mnemonic == "CONTACT_DETECTED"),
-    ("TG-DOM-010", "DIAG-1 expanded (thermal)", lambda: DIAG1.lookup(0x0080) is not None and DIAG1.lookup(0x0080).mnemonic == "THERMAL_MAP"),
-    ("TG-DOM-011", "DIAG-1 expanded (software)", lambda: DIAG1.lookup(0x00B0) is not None and DIAG1.lookup(0x00B0).mnemonic == "PROCESS_LIST"),
-    ("TG-DOM-012", "MANIP-1 grasp planning", lambda: MANIP1.lookup(0x0060) is not None and MANIP1.lookup(0x0060).mnemonic == "GRASP_POSE"),
-    ("TG-DOM-013", "MANIP-1 manipulation actions", lambda: MANIP1.lookup(0x0080) is not None and MANIP1.lookup(0x0080).mnemonic == "PICK"),
-    ("TG-DOM-014", "COMM-1 routing", lambda: COMM1.lookup(0x0020) is not None and COMM1.lookup(0x0020).mnemonic == "UNICAST"),
-    ("TG-DOM-015", "COMM-1 data sync", lambda: COMM1.lookup(0x0080) is not None and COMM1.lookup(0x0080).mnemonic == "SYNC_REQUEST"),
-    ("TG-DOM-016", "SAFETY-1 human safety", lambda: SAFETY1.lookup(0x0020) is not None and SAFETY1.lookup(0x0020).mnemonic == "HUMAN_DETECTED"),
-    ("TG-DOM-017", "SAFETY-1 fault handling", lambda: SAFETY1.lookup(0x0040) is not None and SAFETY1.lookup(0x0040).mnemonic == "FAULT_DETECTED"),
-    ("TG-DOM-018", "SAFETY-1 geofence/regulatory", lambda: SAFETY1.lookup(0x0060) is not None and SAFETY1.lookup(0x0060).mnemonic == "GEOFENCE_BREACH"),
-    ("TG-DOM-019", "7 codebooks in registry", lambda: len(DOMAIN_REGISTRY) == 7),
-    ("TG-DOM-020", "Total domain entries >= 550", lambda: sum(len(cb) for cb in DOMAIN_REGISTRY.values()) >= 550),
-    ("TG-ER-001", "Missing START_UTTERANCE", tg_er_001),
-    ("TG-ER-002", "Truncated data", tg_er_002),
-    ("TG-ER-003", "Insufficient epoch data", tg_er_003),
-]
+# Every test in suite order, as (test id, description, test function)
+_ALL_TESTS = tuple(test for _, group in _SECTIONS for test in group)
+_ALL_TEST_IDS = tuple(test_id for test_id, _, _ in _ALL_TESTS)
 
-@pytest.mark.parametrize("test_id,description,func", _ALL_TESTS, ids=[t[0] for t in _ALL_TESTS])
+@pytest.mark.parametrize("test_id,description,func", _ALL_TESTS, ids=_ALL_TEST_IDS)
 def test_conformance(test_id, description, func):
     assert func(), f"{test_id}: {description}"